@@ -8,8 +8,72 @@ management, prerequisite tracking, and departmental faculty organization.
 Classes:
     Course: Represents individual courses with enrollment and prerequisite management
     Department: Manages collections of courses and faculty for academic departments
+    CourseCache: Bounded least-recently-used cache of lazily loaded courses
 """
 
+import sys
+from collections import OrderedDict, deque
+
+# Bit positions for course ids, shared by every department so that a student's
+# completed-course mask means the same thing whichever department built it.
+# Python ints are arbitrary precision, so there is no limit on course count.
+_COURSE_BITS = {}
+
+
+def _course_bit(course_id):
+    """Return the single-bit mask for a course_id, assigning one on first use."""
+    return 1 << _COURSE_BITS.setdefault(course_id, len(_COURSE_BITS))
+
+
+def _compile_prereq_check(prerequisites):
+    """
+    Build a predicate specialised to one course's prerequisites.
+
+    Most courses have zero, one or two prerequisites, so those shapes get a
+    closure with the course ids baked in; larger sets fall back to a
+    C-level subset test against the dict's keys view.
+
+    Args:
+        prerequisites (frozenset): Course_ids required before the course
+
+    Returns:
+        callable: Takes a dict keyed by course_id, returns True if it
+                  contains every prerequisite
+    """
+    if not prerequisites:
+        return lambda completed: True
+    if len(prerequisites) == 1:
+        (only,) = prerequisites
+        return lambda completed: only in completed
+    if len(prerequisites) == 2:
+        first, second = prerequisites
+        return lambda completed: first in completed and second in completed
+    return lambda completed: completed.keys() >= prerequisites
+
+
+# Prerequisite sets already seen, mapped to the shared frozenset and its
+# compiled check, so courses with identical prerequisites share both objects
+_PREREQ_SETS = {}
+
+
+def _shared_prereqs(prerequisites):
+    """
+    Get the canonical frozenset and compiled check for a prerequisite set.
+
+    Args:
+        prerequisites (iterable): Course_ids required before a course
+
+    Returns:
+        tuple: (frozenset of course_ids, predicate from _compile_prereq_check)
+    """
+    # Interned ids match interned course_ids by identity in dict lookups;
+    # str() first, since sys.intern() only accepts str
+    key = frozenset(sys.intern(str(prereq)) for prereq in prerequisites)
+    shared = _PREREQ_SETS.get(key)
+    if shared is None:
+        shared = _PREREQ_SETS[key] = (key, _compile_prereq_check(key))
+    return shared
+
 
 class Course:
     """
@@ -24,10 +88,15 @@ class Course:
         name (str): Descriptive name of the course
         credits (int): Number of credit hours the course is worth
         enrollment_limit (int): Maximum number of students who can enroll
-        prerequisites (set): Set of course_ids required before taking this course
-        students_enrolled (list): List of Student objects currently enrolled
+        prerequisites (frozenset): Course_ids required before taking this course
+        students_enrolled (dict): Maps person_id to enrolled Student objects
+        check_prereqs (callable): Tests a dict of course_ids against prerequisites
     """
 
+    # Courses exist in large numbers; slots keep each instance compact
+    __slots__ = ('course_id', 'name', 'credits', 'enrollment_limit', 'prerequisites',
+                 'students_enrolled', 'check_prereqs', '_bit', '_prereq_mask')
+
     def __init__(self, course_id, name, credits, limit=30, prerequisites=None):
         """
         Initialize a Course with basic information and constraints.
@@ -39,17 +108,29 @@ class Course:
             limit (int, optional): Maximum enrollment capacity. Defaults to 30.
             prerequisites (list, optional): List of prerequisite course_ids. Defaults to None.
         """
-        self.course_id = course_id
+        # Course ids key every student's enrolled_courses and every
+        # prerequisite set; interning makes those lookups compare by
+        # identity. sys.intern() only accepts str, so ids such as 101 are
+        # stored as "101".
+        self.course_id = sys.intern(str(course_id))
         self.name = name
         self.credits = credits
         self.enrollment_limit = limit
 
-        # Convert prerequisites list to set for efficient subset operations
+        # Convert prerequisites list to an immutable set for efficient subset
+        # operations; frozenset also caches its hash once computed. Identical
+        # sets are shared between courses along with their compiled check.
         # Use empty set if no prerequisites provided
-        self.prerequisites = set(prerequisites) if prerequisites else set()
+        self.prerequisites, self.check_prereqs = _shared_prereqs(prerequisites or ())
+
+        # Bitmask index filled in by Department.finalize(); None means the
+        # course has not been indexed and callers fall back to set checks
+        self._bit = 0
+        self._prereq_mask = None
 
-        # Initialize empty enrollment list
-        self.students_enrolled = []
+        # Dictionary keyed by person_id gives O(1) membership, add and removal
+        # while still preserving enrollment order for iteration via .values()
+        self.students_enrolled = {}
 
     def add_student(self, student):
         """
@@ -64,12 +145,16 @@ class Course:
 
         Returns:
             bool: True if student was successfully added, False if course is full
+                  or the student is already enrolled
         """
-        # Check if there's capacity for another student
-        if len(self.students_enrolled) < self.enrollment_limit:
-            self.students_enrolled.append(student)
+        # Check capacity and guard against duplicate enrollment in O(1); free
+        # seats are derived from the roster so they follow enrollment_limit
+        # and any direct edits to students_enrolled
+        roster = self.students_enrolled
+        if len(roster) < self.enrollment_limit and student.person_id not in roster:
+            roster[student.person_id] = student
             return True  # Successfully enrolled
-        return False  # Course is full
+        return False  # Course is full or student already enrolled
 
     def remove_student(self, student):
         """
@@ -81,14 +166,16 @@ class Course:
         Args:
             student: Student object to remove from enrollment
         """
-        # Only remove if student is actually enrolled
-        if student in self.students_enrolled:
-            self.students_enrolled.remove(student)
+        # Single O(1) removal; missing students are ignored
+        self.students_enrolled.pop(student.person_id, None)
 
     def __str__(self):
         """
         Return a string representation of the course.
 
+        Formatted on every call so it always reflects the current name and
+        credits.
+
         Returns:
             str: Formatted string with course ID, name, and credits
         """
@@ -109,6 +196,9 @@ class Department:
         faculty (list): List of Faculty objects assigned to this department
     """
 
+    __slots__ = ('name', 'courses', 'faculty', '_arrays_dirty', '_ids', '_credits',
+                 '_limits', '_enrolled', '_topo_order', '_dependents', '_course_bit')
+
     def __init__(self, name):
         """
         Initialize a Department with a name and empty collections.
@@ -121,6 +211,12 @@ class Department:
         self.courses = {}
         # Use list for faculty as order might matter and lookups are less frequent
         self.faculty = []
+        # Column-wise NumPy view of the catalog built by build_arrays()
+        self._arrays_dirty = True
+        # Prerequisite index built by finalize()
+        self._topo_order = []
+        self._dependents = {}
+        self._course_bit = {}
 
     def add_course(self, course):
         """
@@ -133,6 +229,32 @@ class Department:
             course: Course object to add to the department
         """
         self.courses[course.course_id] = course
+        self._arrays_dirty = True
+
+    def add_courses(self, courses):
+        """
+        Add several courses to the catalog in one call.
+
+        Equivalent to calling add_course() for each course, but the catalog
+        is updated in a single dict.update() and marked dirty once.
+
+        Args:
+            courses (iterable): Course objects to add to the department
+        """
+        self.courses.update((course.course_id, course) for course in courses)
+        self._arrays_dirty = True
+
+    def get_course(self, course_id):
+        """
+        Look up a course in the department's catalog.
+
+        Args:
+            course_id (str): Id of the course to find
+
+        Returns:
+            Course: The matching course, or None if it is not in the catalog
+        """
+        return self.courses.get(course_id)
 
     def add_faculty(self, faculty_member):
         """
@@ -145,3 +267,237 @@ class Department:
             faculty_member: Faculty object to add to the department
         """
         self.faculty.append(faculty_member)
+
+    def finalize(self):
+        """
+        Build the prerequisite index used for fast enrollment checks.
+
+        Orders the department's courses topologically with Kahn's algorithm
+        (prerequisites first), builds a course -> dependents index and gives
+        every course a bitmask of its prerequisites, so that checking a
+        student's prerequisites becomes a single integer AND. Call it again
+        after adding courses.
+
+        Returns:
+            list: Course ids ordered so that prerequisites come first
+
+        Raises:
+            ValueError: If the course prerequisites contain a cycle
+        """
+        # Count prerequisites inside this department and invert them into a
+        # dependents index; prerequisites from elsewhere do not affect order
+        in_degree = {course_id: 0 for course_id in self.courses}
+        dependents = {course_id: [] for course_id in self.courses}
+        for course_id, course in self.courses.items():
+            for prereq in course.prerequisites:
+                if prereq in dependents:
+                    dependents[prereq].append(course_id)
+                    in_degree[course_id] += 1
+
+        # Kahn's algorithm: repeatedly take courses with no outstanding prerequisites
+        ready = deque(course_id for course_id, degree in in_degree.items() if degree == 0)
+        order = []
+        while ready:
+            course_id = ready.popleft()
+            order.append(course_id)
+            for dependent in dependents[course_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.courses):
+            cyclic = sorted(course_id for course_id, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Prerequisite cycle detected among courses: {', '.join(cyclic)}")
+
+        # Assign bits and fold each course's prerequisites into one mask
+        course_bit = {}
+        for course_id in order:
+            course = self.courses[course_id]
+            course._bit = course_bit.setdefault(course_id, _course_bit(course_id))
+            mask = 0
+            for prereq in course.prerequisites:
+                mask |= course_bit.setdefault(prereq, _course_bit(prereq))
+            course._prereq_mask = mask
+
+        self._topo_order = order
+        self._dependents = dependents
+        self._course_bit = course_bit
+        return order
+
+    def enroll_many(self, course_id, students):
+        """
+        Enroll a batch of students in one course.
+
+        Looks the course up once, computes the free seats once, checks each
+        student's prerequisites with the bitmasks from finalize() and adds
+        everyone admitted to the roster in a single update. Seats are filled
+        in input order; students who are already enrolled (by their own
+        record or on the course roster), repeat a person_id earlier in the
+        batch, or are missing prerequisites are skipped. Unlike
+        Student.enroll_course(), nothing is printed.
+
+        Args:
+            course_id (str): Id of a course in this department
+            students (iterable): Student objects to enroll
+
+        Returns:
+            list: The students who were enrolled
+
+        Raises:
+            KeyError: If course_id is not in this department
+        """
+        course = self.courses[course_id]
+        roster = course.students_enrolled
+        free = course.enrollment_limit - len(roster)
+        if free <= 0:
+            return []
+
+        prereq_mask = course._prereq_mask
+        check_prereqs = course.check_prereqs
+        bit = course._bit
+        seen = set()
+        admitted = []
+        for student in students:
+            enrolled = student.enrolled_courses
+            person_id = student.person_id
+            # One seat per person: skip anyone already on the roster or seen in this batch
+            if course_id in enrolled or person_id in roster or person_id in seen:
+                continue
+            # Same check as Student.enroll_course(): bitmask first, predicate on a miss
+            if ((prereq_mask is None or prereq_mask & ~student._completed_mask)
+                    and not check_prereqs(enrolled)):
+                continue
+            enrolled[course_id] = None
+            student._completed_mask |= bit
+            seen.add(person_id)
+            admitted.append(student)
+            if len(admitted) == free:
+                break
+
+        roster.update((student.person_id, student) for student in admitted)
+        return admitted
+
+    def build_arrays(self):
+        """
+        Build a column-wise (structure of arrays) NumPy view of the catalog.
+
+        Stores one array each for course ids, credits, enrollment limits and
+        current enrollment counts, in self.courses order, so catalog-wide
+        statistics are vectorized reductions instead of Python loops over
+        Course objects. The courses dictionary remains authoritative: the id
+        and credit columns are rebuilt after add_course() or add_courses(),
+        or when the dictionary was changed directly and no longer has as
+        many entries as the arrays. Enrollment limits and counts are
+        refreshed on every call because they change through Course objects
+        the department does not observe.
+
+        Requires NumPy, which is imported on first use.
+        """
+        import numpy as np
+
+        courses = self.courses.values()
+        count = len(self.courses)
+        if self._arrays_dirty or len(self._ids) != count:
+            self._ids = np.array(list(self.courses), dtype=str)
+            self._credits = np.fromiter((c.credits for c in courses), dtype=np.int32, count=count)
+            self._arrays_dirty = False
+        self._limits = np.fromiter((c.enrollment_limit for c in courses), dtype=np.int32, count=count)
+        self._enrolled = np.fromiter((len(c.students_enrolled) for c in courses), dtype=np.int32, count=count)
+
+    def seats_remaining(self):
+        """
+        Get the number of open seats in every course.
+
+        Returns:
+            numpy.ndarray: Remaining seats per course, aligned with self.courses order
+        """
+        self.build_arrays()
+        return self._limits - self._enrolled
+
+    def utilization(self):
+        """
+        Get the fraction of seats taken in every course.
+
+        Returns:
+            numpy.ndarray: Enrolled / limit per course, aligned with self.courses
+                           order; 0.0 for courses with no seats
+        """
+        import numpy as np
+
+        self.build_arrays()
+        limits = self._limits
+        fractions = np.zeros(len(limits), dtype=np.float64)
+        np.divide(self._enrolled, limits, out=fractions, where=limits > 0)
+        return fractions
+
+
+class CourseCache:
+    """
+    Bounded least-recently-used cache for courses loaded on demand.
+
+    Department.courses holds a whole catalog in memory. When only part of a
+    large catalog is in active use, this cache keeps the most recently used
+    courses and loads the rest through a caller-supplied function, evicting
+    the least recently used course once the cache is full.
+
+    Attributes:
+        maxsize (int): Maximum number of courses kept in memory
+    """
+
+    __slots__ = ('maxsize', '_loader', '_courses')
+
+    def __init__(self, loader, maxsize=256):
+        """
+        Initialize an empty cache.
+
+        Args:
+            loader (callable): Takes a course_id and returns the Course for it
+            maxsize (int, optional): Maximum cached courses. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self._loader = loader
+        # OrderedDict keeps the least recently used course at the front
+        self._courses = OrderedDict()
+
+    def get_course(self, course_id):
+        """
+        Return a course, loading it and evicting the oldest entry if needed.
+
+        Args:
+            course_id (str): Id of the course to fetch
+
+        Returns:
+            Course: The cached or newly loaded course
+        """
+        courses = self._courses
+        course = courses.get(course_id)
+        if course is not None:
+            courses.move_to_end(course_id)  # Mark as most recently used
+            return course
+
+        course = self._loader(course_id)
+        courses[course_id] = course
+        if len(courses) > self.maxsize:
+            courses.popitem(last=False)  # Evict least recently used
+        return course
+
+    def __len__(self):
+        """
+        Return the number of cached courses.
+
+        Returns:
+            int: Courses currently held in the cache
+        """
+        return len(self._courses)
+
+    def __contains__(self, course_id):
+        """
+        Check whether a course is cached without loading or reordering it.
+
+        Args:
+            course_id (str): Id of the course to check
+
+        Returns:
+            bool: True if the course is currently cached
+        """
+        return course_id in self._courses
@@ -12,6 +12,8 @@ Classes:
     TA: Teaching Assistants who support course instruction
 """
 
+import sys
+
 from person import Person
 
 
@@ -28,6 +30,12 @@ class Faculty(Person):
         rank (str): Academic rank or title (Professor, Lecturer, TA, etc.)
     """
 
+    __slots__ = ('department', 'rank')
+
+    # Responsibilities are static, so they are built once per class from
+    # the Person base tuple instead of calling super() on every request
+    _RESP = Person._BASE_RESP + ("Conduct research and publish findings.",)
+
     def __init__(self, person_id, name, birth_date, department, rank):
         """
         Initialize a Faculty member with academic information.
@@ -41,8 +49,10 @@ class Faculty(Person):
         """
         # Initialize base Person attributes
         super().__init__(person_id, name, birth_date)
-        self.department = department
-        self.rank = rank
+        # Intern shared strings so identical departments/ranks are one object;
+        # str() first, since sys.intern() only accepts str
+        self.department = sys.intern(str(department))
+        self.rank = sys.intern(str(rank))
 
     def calculate_workload(self):
         """
@@ -58,19 +68,15 @@ class Faculty(Person):
 
     def get_responsibilities(self):
         """
-        Get the list of responsibilities for faculty members.
+        Get the responsibilities for faculty members.
 
         Extends base Person responsibilities with research duties that are
         common to most faculty positions.
 
         Returns:
-            list: List of responsibility strings including research duties
+            tuple: Responsibility strings including research duties
         """
-        # Get base responsibilities from Person class
-        base_resp = super().get_responsibilities()
-        # Add faculty-specific responsibility
-        base_resp.append("Conduct research and publish findings.")
-        return base_resp
+        return self._RESP
 
 
 class Professor(Faculty):
@@ -85,6 +91,8 @@ class Professor(Faculty):
         tenured (bool): Whether the professor has received tenure
     """
 
+    __slots__ = ('tenured',)
+
     def __init__(self, person_id, name, birth_date, department):
         """
         Initialize a Professor.
@@ -121,6 +129,11 @@ class Lecturer(Faculty):
     or publish scholarly work.
     """
 
+    __slots__ = ()
+
+    # Replaces the Faculty responsibilities to drop the research duty
+    _RESP = Person._BASE_RESP + ("Focus on teaching and student instruction.",)
+
     def __init__(self, person_id, name, birth_date, department):
         """
         Initialize a Lecturer.
@@ -148,16 +161,15 @@ class Lecturer(Faculty):
 
     def get_responsibilities(self):
         """
-        Get the list of responsibilities specific to lecturers.
+        Get the responsibilities specific to lecturers.
 
         Overrides the base Faculty responsibilities to remove research
         requirements and focus solely on teaching duties.
 
         Returns:
-            list: List of teaching-focused responsibilities
+            tuple: Teaching-focused responsibility strings
         """
-        # Override completely to remove research responsibility
-        return ["Adhere to university policies.", "Focus on teaching and student instruction."]
+        return self._RESP
 
 
 class TA(Faculty):
@@ -172,6 +184,8 @@ class TA(Faculty):
         assisting_course: Course object that the TA is assigned to assist
     """
 
+    __slots__ = ('assisting_course',)
+
     def __init__(self, person_id, name, birth_date, department, assisting_course):
         """
         Initialize a Teaching Assistant.
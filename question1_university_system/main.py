@@ -14,12 +14,6 @@ The system demonstrates:
 - Business logic for course enrollment and academic management
 """
 
-# Import specific classes from each module
-from person import Staff
-from student import UndergraduateStudent, SecureStudentRecord
-from faculty import Professor, Lecturer
-from department import Department, Course
-
 
 def main():
     """
@@ -29,86 +23,120 @@ def main():
     courses, and various types of personnel, then demonstrates key system
     functionality including enrollment, grading, and polymorphic behavior.
     """
-    print("--- University Management System ---")
+    # Import specific classes from each module; deferred until main() runs so
+    # importing this module stays cheap
+    import logging
+    import sys
+    from person import Staff
+    from student import UndergraduateStudent, SecureStudentRecord
+    from faculty import Faculty, Professor, Lecturer
+    from department import Department, Course
+
+    # Enrollment messages are logged by the student module; show them on
+    # stdout alongside the rest of the demo output
+    student_log = logging.getLogger("student")
+    previous_level = student_log.level
+    log_handler = logging.StreamHandler(sys.stdout)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    student_log.addHandler(log_handler)
+    student_log.setLevel(logging.INFO)
+
+    try:
+        print("--- University Management System ---")
 
-    # === DEPARTMENT AND COURSE SETUP ===
+        # === DEPARTMENT AND COURSE SETUP ===
 
-    # Create Computer Science department
-    cs_dept = Department("Computer Science")
+        # Create Computer Science department
+        cs_dept = Department("Computer Science")
 
-    # Create courses with prerequisite relationships
-    cs101 = Course("CS101", "Intro to Programming", 3, prerequisites=None)
-    cs201 = Course("CS201", "Data Structures", 3, prerequisites={"CS101"})
+        # Create courses with prerequisite relationships
+        cs101 = Course("CS101", "Intro to Programming", 3, prerequisites=None)
+        cs201 = Course("CS201", "Data Structures", 3, prerequisites={"CS101"})
 
-    # Add courses to department catalog
-    cs_dept.add_course(cs101)
-    cs_dept.add_course(cs201)
+        # Add courses to department catalog
+        cs_dept.add_courses([cs101, cs201])
 
-    # === PERSONNEL CREATION ===
+        # Index prerequisites so enrollment checks are a single bitmask test
+        cs_dept.finalize()
 
-    # Create various types of university personnel using historical figures
-    prof_ada = Professor("F101", "Ada Lovelace", "1815-12-10", "Computer Science")
-    lect_grace = Lecturer("F102", "Grace Hopper", "1906-12-09", "Computer Science")
-    student_alan = UndergraduateStudent("S201", "Alan Turing", "1912-06-23", "CS", 3)
-    staff_bob = Staff("ST301", "Bob Admin", "1980-05-15", "Admissions", "Administrator")
+        # === PERSONNEL CREATION ===
 
-    # === ENROLLMENT DEMONSTRATION ===
+        # Create various types of university personnel using historical figures
+        prof_ada = Professor("F101", "Ada Lovelace", "1815-12-10", "Computer Science")
+        lect_grace = Lecturer("F102", "Grace Hopper", "1906-12-09", "Computer Science")
+        student_alan = UndergraduateStudent("S201", "Alan Turing", "1912-06-23", "CS", 3)
+        staff_bob = Staff("ST301", "Bob Admin", "1980-05-15", "Admissions", "Administrator")
 
-    print("\n--- Course Enrollment Process ---")
+        # === ENROLLMENT DEMONSTRATION ===
 
-    # Attempt to enroll student in courses
-    student_alan.enroll_course(cs101, cs_dept)  # Should succeed - no prerequisites
-    student_alan.enroll_course(cs201, cs_dept)  # Should fail - missing CS101 prerequisite
+        print("\n--- Course Enrollment Process ---")
 
-    # Simulate completion of CS101 by assigning a grade
-    student_alan.enrolled_courses["CS101"] = 'A'  # Manual grade assignment for demo
-    print("CS101 completed with grade 'A'")
+        # Attempt to enroll student in courses
+        student_alan.enroll_course(cs101, cs_dept)  # Should succeed - no prerequisites
+        student_alan.enroll_course(cs201, cs_dept)  # Should fail - missing CS101 prerequisite
 
-    # Now CS201 enrollment should succeed
-    student_alan.enroll_course(cs201, cs_dept)  # Should succeed now
+        # Simulate completion of CS101 by assigning a grade
+        student_alan.set_grade("CS101", 'A')
+        print("CS101 completed with grade 'A'")
 
-    # === ACADEMIC PERFORMANCE CALCULATION ===
+        # Now CS201 enrollment should succeed
+        student_alan.enroll_course(cs201, cs_dept)  # Should succeed now
 
-    print(f"\nAlan's GPA: {student_alan.calculate_gpa()}")
-    print(f"Alan's Academic Status: {student_alan.get_academic_status()}")
+        # === ACADEMIC PERFORMANCE CALCULATION ===
 
-    # === POLYMORPHISM DEMONSTRATION ===
+        print(f"\nAlan's GPA: {student_alan.calculate_gpa()}")
+        print(f"Alan's Academic Status: {student_alan.get_academic_status()}")
 
-    # Create a heterogeneous list of different person types
-    university_people = [prof_ada, lect_grace, student_alan, staff_bob]
+        # === POLYMORPHISM DEMONSTRATION ===
 
-    print("\n--- Demonstrating Polymorphism ---")
+        # Create a heterogeneous list of different person types
+        university_people = [prof_ada, lect_grace, student_alan, staff_bob]
 
-    # Iterate through different person types using common interface
-    for person in university_people:
-        print(f"\nName: {person.name} ({person.__class__.__name__})")
-        print("Responsibilities:")
+        print("\n--- Demonstrating Polymorphism ---")
 
-        # All Person objects have get_responsibilities() method (polymorphism)
-        for resp in person.get_responsibilities():
-            print(f"- {resp}")
+        # Group people by concrete type (first-seen order) so methods are
+        # resolved once per class rather than once per person
+        people_by_type = {}
+        for person in university_people:
+            people_by_type.setdefault(type(person), []).append(person)
 
-        # Check for faculty-specific methods using duck typing
-        # This demonstrates how we can handle different object types gracefully
-        if hasattr(person, 'calculate_workload'):
-            print(f"Workload: {person.calculate_workload()}")
+        # Iterate through different person types using common interface
+        for person_type, people in people_by_type.items():
+            # All Person classes have get_responsibilities() method (polymorphism)
+            get_responsibilities = person_type.get_responsibilities
+            # Only faculty members define a workload
+            calculate_workload = person_type.calculate_workload if issubclass(person_type, Faculty) else None
 
-    # === ENCAPSULATION DEMONSTRATION ===
+            for person in people:
+                print(f"\nName: {person.name} ({person.TYPE_NAME})")
+                print("Responsibilities:")
 
-    print("\n--- Demonstrating Encapsulation ---")
+                for resp in get_responsibilities(person):
+                    print(f"- {resp}")
 
-    # Create secure student record with encapsulated data
-    secure_record = SecureStudentRecord(student_alan, 3.8)
-    print(f"Secure record for {secure_record.get_student_name()} has GPA: {secure_record.get_gpa()}")
+                if calculate_workload is not None:
+                    print(f"Workload: {calculate_workload(person)}")
 
-    # Demonstrate validation in encapsulated setter
-    try:
-        # This should fail due to validation (GPA > 4.0)
-        secure_record.set_gpa(5.0)
-    except ValueError as e:
-        print(f"Error setting invalid GPA: {e}")
+        # === ENCAPSULATION DEMONSTRATION ===
+
+        print("\n--- Demonstrating Encapsulation ---")
+
+        # Create secure student record with encapsulated data
+        secure_record = SecureStudentRecord(student_alan, 3.8)
+        print(f"Secure record for {secure_record.student_name} has GPA: {secure_record.gpa}")
+
+        # Demonstrate validation in encapsulated setter
+        try:
+            # This should fail due to validation (GPA > 4.0)
+            secure_record.gpa = 5.0
+        except ValueError as e:
+            print(f"Error setting invalid GPA: {e}")
 
-    print("\n--- System Demonstration Complete ---")
+        print("\n--- System Demonstration Complete ---")
+    finally:
+        # Leave the student logger as it was before the demo, even if it failed
+        student_log.removeHandler(log_handler)
+        student_log.setLevel(previous_level)
 
 
 # Standard Python idiom for running main function when script is executed directly
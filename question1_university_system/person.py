@@ -10,7 +10,8 @@ Classes:
     Staff: Non-academic personnel with specific departmental roles
 """
 
-import datetime
+import sys
+from datetime import date as _date
 
 
 class Person:
@@ -27,6 +28,27 @@ class Person:
         birth_date (str): Birth date in YYYY-MM-DD format
     """
 
+    # Fixed attribute set, so instances skip the per-instance __dict__
+    __slots__ = ('person_id', 'name', 'birth_date', '_birth_date_obj')
+
+    # Responsibilities shared by everyone; subclasses extend this tuple
+    _BASE_RESP = ("Adhere to university policies.",)
+
+    # Display name of the class, used by reports instead of __class__.__name__
+    TYPE_NAME = "Person"
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Give every subclass its own TYPE_NAME when the class is defined.
+
+        The class name is used unless the subclass declares TYPE_NAME itself.
+
+        Args:
+            **kwargs: Passed on to the parent implementation
+        """
+        super().__init_subclass__(**kwargs)
+        cls.TYPE_NAME = cls.__dict__.get('TYPE_NAME', cls.__name__)
+
     def __init__(self, person_id, name, birth_date):
         """
         Initialize a Person with basic information.
@@ -35,10 +57,15 @@ class Person:
             person_id (str): Unique identifier for the person
             name (str): Full name of the person
             birth_date (str): Birth date in YYYY-MM-DD format
+
+        Raises:
+            ValueError: If birth_date is not a valid ISO date
         """
         self.person_id = person_id
         self.name = name
         self.birth_date = birth_date
+        # Parse the birth date once so get_age() does no string parsing
+        self._birth_date_obj = _date.fromisoformat(birth_date)
 
     def get_age(self):
         """
@@ -48,23 +75,25 @@ class Person:
             int: Current age in years, accounting for whether birthday has
                  occurred this year
         """
-        today = datetime.date.today()
-        birth_date_obj = datetime.datetime.strptime(self.birth_date, "%Y-%m-%d").date()
+        today = _date.today()
+        b = self._birth_date_obj
 
         # Calculate age, adjusting for whether birthday has occurred this year
-        return today.year - birth_date_obj.year - ((today.month, today.day) < (birth_date_obj.month, birth_date_obj.day))
+        return today.year - b.year - ((today.month, today.day) < (b.month, b.day))
 
     def get_responsibilities(self):
         """
-        Get the list of responsibilities for this person.
+        Get the responsibilities for this person.
 
         This method is designed to be overridden by subclasses to provide
         specific responsibilities for different types of university personnel.
+        Every class in the hierarchy returns a tuple, which callers must not
+        modify since it may be shared between instances.
 
         Returns:
-            list: List of responsibility strings
+            tuple: Responsibility strings
         """
-        return ["Adhere to university policies."]
+        return self._BASE_RESP
 
     def __str__(self):
         """
@@ -88,6 +117,8 @@ class Staff(Person):
         role (str): Specific job title or role description
     """
 
+    __slots__ = ('department', 'role', '_responsibilities')
+
     def __init__(self, person_id, name, birth_date, department, role):
         """
         Initialize a Staff member with personal and employment information.
@@ -101,20 +132,22 @@ class Staff(Person):
         """
         # Call parent constructor to initialize common attributes
         super().__init__(person_id, name, birth_date)
-        self.department = department
-        self.role = role
+        # Intern shared strings so identical departments/roles are one object;
+        # str() first, since sys.intern() only accepts str
+        self.department = sys.intern(str(department))
+        self.role = sys.intern(str(role))
+        # Role and department are fixed, so build the responsibilities once
+        self._responsibilities = self._BASE_RESP + (
+            f"Perform {role} duties for the {department} department.",
+        )
 
     def get_responsibilities(self):
         """
-        Get the list of responsibilities for this staff member.
+        Get the responsibilities for this staff member.
 
         Extends the base responsibilities with department-specific duties.
 
         Returns:
-            list: List of responsibility strings including base and role-specific duties
+            tuple: Responsibility strings including base and role-specific duties
         """
-        # Get base responsibilities from parent class
-        base_resp = super().get_responsibilities()
-        # Add role-specific responsibility
-        base_resp.append(f"Perform {self.role} duties for the {self.department} department.")
-        return base_resp
+        return self._responsibilities
@@ -11,141 +11,673 @@ All test files are now organized in the test_code directory for better project s
 import unittest
 import sys
 import os
+import io
+import json
+import importlib
+import logging
+import time
+from multiprocessing import Pipe, Process, cpu_count
+from multiprocessing.connection import wait
+from pathlib import Path
+
+# Directory holding the test modules, resolved once at import
+_TEST_CODE_DIR = Path(__file__).resolve().parent / 'test_code'
+
+# Estimated serial run time, in seconds, below which worker processes cost
+# more than they save. Starting and warming up one worker measured about
+# 0.01 s, plus pickling every batch report back; the whole current suite
+# runs in under 0.01 s in-process, so it never reaches this.
+PARALLEL_MIN_SECONDS = 0.25
+
+# Message that makes a worker import the application modules ahead of the
+# first batch, so no batch pays for those imports
+WARMUP_MESSAGE = ['__import_warmup__']
+WARMUP_MODULES = ('person', 'student', 'faculty', 'department')
+
+# Directories never searched for tests, in addition to hidden ones
+SKIP_DIRS = frozenset({'__pycache__', '.venv', 'venv', 'node_modules', 'build', 'dist'})
+
+# Test modules imported by run_specific_test_module(), so repeated runs in one
+# process skip the import machinery, and the (module, mtime) pairs seen by
+# the last list_available_tests() scan, used to notice changed files
+_loaded_test_modules = {}
+_seen_test_files = None
+
+
+def _is_test_file(entry):
+    """
+    Check whether a directory entry is a test module.
+
+    Args:
+        entry (os.DirEntry): Entry from os.scandir
+
+    Returns:
+        bool: True for a regular test_*.py file
+    """
+    name = entry.name
+    return name.startswith('test_') and name.endswith('.py') and entry.is_file(follow_symlinks=False)
+
+
+def _collect_test_files(directory, package, found):
+    """
+    Add the test modules under a directory to a list, recursing into subdirectories.
+
+    Cache, environment and hidden directories are pruned before descending.
+
+    Args:
+        directory (str): Directory to scan
+        package (str): Dotted module prefix for this directory ('' at the top)
+        found (list): Receives (module name, st_mtime_ns) pairs
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if _is_test_file(entry):
+                found.append((package + entry.name[:-3], entry.stat(follow_symlinks=False).st_mtime_ns))
+            elif (entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS
+                    and not entry.name.startswith('.')):
+                _collect_test_files(entry.path, f"{package}{entry.name}.", found)
+
+
+def _scan_test_files(test_code_dir):
+    """
+    List test modules together with their modification times.
+
+    Uses os.scandir so each entry's type and stat come from the directory
+    walk itself rather than a separate system call per file.
+
+    Args:
+        test_code_dir (str): Directory containing the test modules
+
+    Returns:
+        list: (module name, st_mtime_ns) pairs sorted by module name; modules
+              in subdirectories get dotted names
+    """
+    found = []
+    _collect_test_files(test_code_dir, '', found)
+    found.sort()
+    return found
+
+
+def _init_worker(test_code_dir):
+    """
+    Prepare the current process to run the test modules.
+
+    Makes the test modules and the application modules they test
+    importable, and silences the student module's enrollment messages,
+    which are logged at INFO level.
+
+    Args:
+        test_code_dir (str or Path): Directory containing the test modules
+    """
+    test_code_dir = os.fspath(test_code_dir)
+    for path in (os.path.dirname(test_code_dir), test_code_dir):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    logging.getLogger('student').setLevel(logging.WARNING)
+
+
+def _summarise(result):
+    """
+    Reduce a TestResult to plain values that can be sent between processes.
+
+    Args:
+        result: unittest.TestResult to summarise
+
+    Returns:
+        tuple: (tests run, failures, errors, skipped count) where failures and
+               errors are lists of (test description, traceback) strings
+    """
+    return (
+        result.testsRun,
+        [(str(test), traceback) for test, traceback in result.failures],
+        [(str(test), traceback) for test, traceback in result.errors],
+        len(result.skipped),
+    )
+
+
+def _run_shard(module_names):
+    """
+    Run a group of test modules in a worker process.
+
+    The verbose report is captured rather than written to the terminal, so
+    shards running at the same time do not interleave their output.
+
+    Args:
+        module_names (list): Test module names to run
+
+    Returns:
+        tuple: The _summarise() values followed by the captured report text
+    """
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromNames(module_names)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2, buffer=True).run(suite)
+    return _summarise(result) + (stream.getvalue(),)
+
+
+def _worker_loop(conn, test_code_dir):
+    """
+    Run test batches received over a pipe until the parent says to stop.
+
+    Each message is a list of test module names, answered with the
+    _run_shard() result; None ends the loop.
+
+    Args:
+        conn: Worker end of a multiprocessing Pipe
+        test_code_dir (str): Directory containing the test modules
+    """
+    _init_worker(test_code_dir)
+    while True:
+        module_names = conn.recv()
+        if module_names is None:
+            break
+        if module_names == WARMUP_MESSAGE:
+            for module_name in WARMUP_MODULES:
+                importlib.import_module(module_name)
+            conn.send(None)
+        else:
+            conn.send(_run_shard(module_names))
+    conn.close()
+
+
+def _start_workers(count, test_code_dir):
+    """
+    Start long-lived worker processes and wait until they are warmed up.
+
+    A worker that dies during warm-up (for example because an application
+    module fails to import) is stopped and left out, and reported through
+    _batch_error() instead of raising in the parent.
+
+    Args:
+        count (int): Number of workers to start
+        test_code_dir (str): Directory containing the test modules
+
+    Returns:
+        tuple: (list of (process, connection) pairs that warmed up,
+                list of _batch_error() results for workers that did not)
+    """
+    started = []
+    try:
+        for _ in range(count):
+            parent_conn, child_conn = Pipe()
+            process = Process(target=_worker_loop, args=(child_conn, test_code_dir), daemon=True)
+            process.start()
+            child_conn.close()
+            started.append((process, parent_conn))
+            parent_conn.send(WARMUP_MESSAGE)
+    except BaseException:
+        _stop_workers(started)
+        raise
+
+    workers, failed = [], []
+    for process, conn in started:
+        try:
+            conn.recv()  # Warm-up acknowledgement
+        except (EOFError, OSError) as exc:
+            _stop_workers([(process, conn)])
+            failed.append(_batch_error(
+                WARMUP_MESSAGE,
+                f"Worker process failed to warm up (exit code {process.exitcode}): {exc!r}"))
+        else:
+            workers.append((process, conn))
+    return workers, failed
+
+
+def _batch_error(batch, message):
+    """
+    Build a _run_shard()-style result for a batch that could not be run.
+
+    Args:
+        batch (list): Test module names in the batch
+        message (str): Why the batch did not run
+
+    Returns:
+        tuple: Result with one error naming the batch and no tests run
+    """
+    test = f"batch [{', '.join(batch)}]"
+    return (0, [], [(test, message)], 0, f"ERROR: {test}\n{message}\n")
+
+
+def _failed_batch(process, batch, exc):
+    """
+    Build the result for a batch whose worker died while running it.
+
+    Args:
+        process: The worker's multiprocessing Process
+        batch (list): Test module names the worker was running
+        exc (Exception): Error raised while talking to the worker
+
+    Returns:
+        tuple: Result from _batch_error()
+    """
+    process.join(timeout=1)
+    return _batch_error(batch, f"Worker process exited (exit code {process.exitcode}) "
+                               f"before reporting results: {exc!r}")
+
+
+def _run_batches(workers, batches):
+    """
+    Feed batches to idle workers and yield each result as it arrives.
+
+    A worker that dies is dropped; the batch it was running is reported as
+    an error and the remaining batches go to the surviving workers. If no
+    worker survives, every batch not yet run is reported as an error too.
+
+    Args:
+        workers (list): (process, connection) pairs from _start_workers()
+        batches (list): Lists of test module names
 
+    Yields:
+        tuple: The _run_shard() result for one batch
+    """
+    pending = iter(batches)
+    processes = {conn: process for process, conn in workers}
+    running = {}  # Connection -> batch it is running
+
+    def dispatch(conn):
+        # Send the next batch to an idle worker; returns a failure result
+        # if the worker is already gone
+        batch = next(pending, None)
+        if batch is None:
+            return None
+        running[conn] = batch
+        try:
+            conn.send(batch)
+        except OSError as exc:
+            del running[conn]
+            return _failed_batch(processes[conn], batch, exc)
+        return None
+
+    for conn in processes:
+        failed = dispatch(conn)
+        if failed is not None:
+            yield failed
+
+    while running:
+        for conn in wait(list(running)):
+            batch = running.pop(conn)
+            try:
+                result = conn.recv()
+            except (EOFError, OSError) as exc:
+                yield _failed_batch(processes[conn], batch, exc)
+                continue
+            yield result
+            failed = dispatch(conn)
+            if failed is not None:
+                yield failed
+
+    for batch in pending:
+        yield _batch_error(batch, "Not run: no worker processes left")
+
+
+def _stop_workers(workers):
+    """
+    Tell every worker to exit and wait for it.
+
+    Workers that have already died are only joined; any that do not exit
+    promptly are terminated, so no worker outlives the run.
+
+    Args:
+        workers (list): (process, connection) pairs from _start_workers()
+    """
+    for process, conn in workers:
+        if process.is_alive():
+            try:
+                conn.send(None)
+            except OSError:
+                pass  # Pipe already broken; terminated below if still running
+        conn.close()
+
+    for process, _ in workers:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+
+def _write_json_summary(tests_run, failures, errors, skipped):
+    """
+    Write the machine-readable run summary to stdout.
 
-def discover_and_run_tests():
+    Args:
+        tests_run (int): Number of tests run
+        failures (list): (test description, traceback) pairs
+        errors (list): (test description, traceback) pairs
+        skipped (int): Number of skipped tests
+    """
+    summary = {
+        'run': tests_run,
+        'failures': [{'test': test, 'traceback': traceback} for test, traceback in failures],
+        'errors': [{'test': test, 'traceback': traceback} for test, traceback in errors],
+        'skipped': skipped,
+    }
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+def discover_and_run_tests(batch_size=None, json_output=False):
     """
     Discover and run all tests in the test_code directory.
 
+    The first module runs in this process and is timed. When the rest of
+    the suite is estimated to take at least PARALLEL_MIN_SECONDS and there
+    is more than one CPU core, the remaining modules are split into batches
+    and fed to long-lived worker processes, up to one per core, that import
+    the application once and then run batch after batch. Otherwise they
+    run in this process too.
+
+    Output printed by passing tests is buffered and dropped; the runner's
+    report shows it, with the traceback, only for tests that fail.
+
+    Args:
+        batch_size (int, optional): Test modules sent to a worker at a time.
+            Defaults to an even split of the modules across the workers.
+            Ignored when the tests run in this process.
+        json_output (bool): Write a machine-readable summary to stdout and
+            send the human-readable report to stderr instead
+
     Returns:
         bool: True if all tests passed, False if any failed
     """
-    # Set up test loader
-    loader = unittest.TestLoader()
+    # The human-readable report goes to stderr when stdout carries JSON
+    report = sys.stderr if json_output else sys.stdout
 
     # Discover all test files (test_*.py) in the test_code directory
-    test_code_dir = os.path.join(os.path.dirname(__file__), 'test_code')
+    test_code_dir = _TEST_CODE_DIR
 
-    if not os.path.exists(test_code_dir):
-        print(f"❌ Test directory not found: {test_code_dir}")
+    if not test_code_dir.exists():
+        print(f"❌ Test directory not found: {test_code_dir}", file=report)
         return False
 
-    test_suite = loader.discover(test_code_dir, pattern='test_*.py')
+    modules = [name for name, _ in _scan_test_files(test_code_dir)]
+    _init_worker(test_code_dir)
 
-    # Create test runner with verbose output
+    # Run the tests
+    print("=" * 70, file=report)
+    print("UNIVERSITY MANAGEMENT SYSTEM - TEST SUITE", file=report)
+    print("=" * 70, file=report)
+    print(f"Running tests from: {test_code_dir}", file=report)
+    print("=" * 70, file=report)
+
+    # Time the first module in this process and extrapolate to the rest;
+    # only hand the rest to workers when that estimate pays for starting
+    # them and there is more than one core to run them on
     runner = unittest.TextTestRunner(
         verbosity=2,
-        stream=sys.stdout,
+        stream=report,
         descriptions=True,
-        failfast=False
+        failfast=False,
+        buffer=True
     )
-
-    # Run the tests
-    print("=" * 70)
-    print("UNIVERSITY MANAGEMENT SYSTEM - TEST SUITE")
-    print("=" * 70)
-    print(f"Running tests from: {test_code_dir}")
-    print("=" * 70)
-
-    result = runner.run(test_suite)
+    loader = unittest.TestLoader()
+    started = time.perf_counter()
+    results = [_summarise(runner.run(loader.loadTestsFromNames(modules[:1])))]
+    rest = modules[1:]
+    estimate = (time.perf_counter() - started) * len(rest)
+
+    workers_available = cpu_count()
+    if workers_available < 2 or estimate < PARALLEL_MIN_SECONDS:
+        if batch_size is not None:
+            print(f"⚠️  --batch-size {batch_size} ignored: the suite is estimated at "
+                  f"{estimate:.3f}s on {workers_available} core(s), so it runs in this process",
+                  file=report)
+        if rest:
+            results.append(_summarise(runner.run(loader.loadTestsFromNames(rest))))
+    else:
+        # Split the remaining modules into batches and collect each batch's
+        # results as it finishes
+        if batch_size is None:
+            batch_size = -(-len(rest) // min(workers_available, len(rest)))
+        batches = [rest[i:i + batch_size] for i in range(0, len(rest), batch_size)]
+        workers, warmup_failures = _start_workers(min(workers_available, len(batches)), test_code_dir)
+        for failed in warmup_failures:
+            report.write(failed[-1])
+            results.append(failed[:-1])
+        try:
+            for batch in _run_batches(workers, batches):
+                report.write(batch[-1])
+                results.append(batch[:-1])
+        finally:
+            _stop_workers(workers)
+
+    tests_run = sum(result[0] for result in results)
+    failures = [failure for result in results for failure in result[1]]
+    errors = [error for result in results for error in result[2]]
+    skipped = sum(result[3] for result in results)
+
+    if json_output:
+        _write_json_summary(tests_run, failures, errors, skipped)
 
     # Print summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
-
-    if result.wasSuccessful():
-        print("\n✅ ALL TESTS PASSED!")
+    print("\n" + "=" * 70, file=report)
+    print("TEST SUMMARY", file=report)
+    print("=" * 70, file=report)
+    print(f"Tests run: {tests_run}", file=report)
+    print(f"Failures: {len(failures)}", file=report)
+    print(f"Errors: {len(errors)}", file=report)
+    print(f"Skipped: {skipped}", file=report)
+
+    if not failures and not errors:
+        print("\n✅ ALL TESTS PASSED!", file=report)
         return True
     else:
-        print("\n❌ SOME TESTS FAILED!")
+        print("\n❌ SOME TESTS FAILED!", file=report)
+
+        # The runner report above already holds each traceback, so only
+        # name the tests here instead of formatting them a second time
+        if failures:
+            print("\nFAILURES:", file=report)
+            for test, _ in failures:
+                print(f"- {test}", file=report)
+
+        if errors:
+            print("\nERRORS:", file=report)
+            for test, _ in errors:
+                print(f"- {test}", file=report)
+
+        return False
+
+
+def _test_module_name(name):
+    """
+    Turn a command line module name into a test module name.
+
+    Args:
+        name (str): Name such as 'student', 'test_student' or 'pkg.test_x'
+
+    Returns:
+        str: Name with the 'test_' prefix (dotted names are used as given)
+    """
+    if '.' not in name and not name.startswith('test_'):
+        return f'test_{name}'
+    return name
+
 
-        # Print failure details
-        if result.failures:
-            print("\nFAILURES:")
-            for test, traceback in result.failures:
-                print(f"- {test}")
-                print(f"  {traceback}\n")
+def run_with_pytest(module_names, last_failed=False):
+    """
+    Run the tests with pytest instead of the built-in runner.
 
-        if result.errors:
-            print("\nERRORS:")
-            for test, traceback in result.errors:
-                print(f"- {test}")
-                print(f"  {traceback}\n")
+    Uses pytest-xdist to spread tests over every core when it is installed,
+    and pytest's cache to rerun only the last failures when asked. Settings
+    such as the test directory live in pytest.ini next to this script.
+
+    Args:
+        module_names (list): Modules to run, as accepted on the command
+                             line; all tests are run when empty
+        last_failed (bool): Run only the tests that failed last time
 
+    Returns:
+        bool: True if all tests passed, False otherwise
+    """
+    try:
+        import pytest
+    except ImportError:
+        print("❌ pytest is not installed (pip install pytest pytest-xdist)")
         return False
 
+    test_code_dir = _TEST_CODE_DIR
+    pytest_args = [
+        str(test_code_dir.joinpath(*_test_module_name(name).split('.')).with_suffix('.py'))
+        for name in module_names
+    ] or [str(test_code_dir)]
+
+    try:
+        import xdist  # noqa: F401 - only checks that the plugin is available
+        pytest_args += ['-n', 'auto']
+    except ImportError:
+        pass
+    if last_failed:
+        pytest_args.append('--last-failed')
+
+    _init_worker(test_code_dir)
+    return pytest.main(pytest_args) == 0
+
 
-def run_specific_test_module(module_name):
+def run_specific_test_module(module_name, json_output=False):
     """
     Run tests for a specific module in the test_code directory.
 
     Args:
         module_name (str): Name of the test module (e.g., 'test_student' or 'student')
+        json_output (bool): Write the same JSON summary as
+            discover_and_run_tests() to stdout and send the human-readable
+            report to stderr instead
+
+    Returns:
+        bool: True if all tests passed, False otherwise
     """
-    # Ensure module name starts with 'test_'
-    if not module_name.startswith('test_'):
-        module_name = f'test_{module_name}'
+    module_name = _test_module_name(module_name)
+    report = sys.stderr if json_output else sys.stdout
 
     # Add test_code directory to Python path
-    test_code_dir = os.path.join(os.path.dirname(__file__), 'test_code')
-    if test_code_dir not in sys.path:
-        sys.path.insert(0, test_code_dir)
+    _init_worker(_TEST_CODE_DIR)
 
     try:
-        # Import the test module from test_code directory
-        test_module = __import__(module_name)
+        # Import the test module from test_code directory, reusing a module
+        # this process already loaded
+        test_module = _loaded_test_modules.get(module_name)
+        if test_module is None:
+            test_module = _loaded_test_modules[module_name] = importlib.import_module(module_name)
+    except ImportError as e:
+        print(f"❌ Could not import test module '{module_name}' from test_code directory", file=report)
+        print(f"   Error: {e}", file=report)
+        print(f"   Make sure the file 'test_code/{module_name}.py' exists", file=report)
+        if json_output:
+            _write_json_summary(0, [], [(module_name, f"ImportError: {e}")], 0)
+        return False
 
-        # Create test suite
-        loader = unittest.TestLoader()
-        suite = loader.loadTestsFromModule(test_module)
+    # Create test suite
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(test_module)
 
-        # Run tests
-        runner = unittest.TextTestRunner(verbosity=2)
-        print("=" * 70)
-        print(f"RUNNING TESTS FOR MODULE: {module_name}")
-        print("=" * 70)
+    # Run tests
+    runner = unittest.TextTestRunner(stream=report, verbosity=2, buffer=True)
+    print("=" * 70, file=report)
+    print(f"RUNNING TESTS FOR MODULE: {module_name}", file=report)
+    print("=" * 70, file=report)
 
-        result = runner.run(suite)
+    result = runner.run(suite)
+    if json_output:
+        _write_json_summary(*_summarise(result))
 
-        return result.wasSuccessful()
+    return result.wasSuccessful()
 
-    except ImportError as e:
-        print(f"❌ Could not import test module '{module_name}' from test_code directory")
-        print(f"   Error: {e}")
-        print(f"   Make sure the file 'test_code/{module_name}.py' exists")
-        return False
+
+def _refresh_import_caches(scan):
+    """
+    Invalidate import caches when test files appeared or changed on disk.
+
+    Modules loaded by run_specific_test_module() whose file changed since the
+    previous scan are forgotten, so the next run imports them again.
+
+    Args:
+        scan (list): (module name, mtime_ns) pairs from _scan_test_files()
+    """
+    global _seen_test_files
+    current = dict(scan)
+    if _seen_test_files is not None and current != _seen_test_files:
+        importlib.invalidate_caches()
+        for name, mtime in current.items():
+            if _seen_test_files.get(name) != mtime:
+                _loaded_test_modules.pop(name, None)
+                sys.modules.pop(name, None)
+    _seen_test_files = current
 
 
 def list_available_tests():
     """List all available test modules in the test_code directory."""
-    test_code_dir = os.path.join(os.path.dirname(__file__), 'test_code')
+    test_code_dir = _TEST_CODE_DIR
 
-    if not os.path.exists(test_code_dir):
+    if not test_code_dir.exists():
         print(f"❌ Test directory not found: {test_code_dir}")
         return
 
     print("Available test modules:")
-    test_files = [f for f in os.listdir(test_code_dir) if f.startswith('test_') and f.endswith('.py')]
+    scan = _scan_test_files(test_code_dir)
+    _refresh_import_caches(scan)
+    test_modules = [name for name, _ in scan]
 
-    if not test_files:
+    if not test_modules:
         print("  No test files found in test_code directory")
         return
 
-    for test_file in sorted(test_files):
-        module_name = test_file[:-3]  # Remove .py extension
-        short_name = module_name[5:]  # Remove 'test_' prefix
+    for module_name in test_modules:
+        # Remove 'test_' prefix from top-level modules; nested ones keep their full name
+        short_name = module_name if '.' in module_name else module_name[5:]
         print(f"  - {module_name} (run with: python run_tests.py {short_name})")
 
 
+def _pop_option(args, name):
+    """
+    Remove a "--name value" option from an argument list.
+
+    Args:
+        args (list): Command line arguments, modified in place
+        name (str): Option name including the leading dashes
+
+    Returns:
+        str: The option value, or None if the option was not given
+    """
+    if name not in args:
+        return None
+    index = args.index(name)
+    if index + 1 >= len(args):
+        raise ValueError(f"{name} needs a value")
+    value = args[index + 1]
+    del args[index:index + 2]
+    return value
+
+
 def main():
     """Main function to handle command line arguments and run tests."""
-    if len(sys.argv) > 1:
-        arg = sys.argv[1].lower()
+    args = sys.argv[1:]
+    try:
+        batch_size = _pop_option(args, '--batch-size')
+        if batch_size is not None:
+            batch_size = int(batch_size)
+            if batch_size < 1:
+                raise ValueError(batch_size)
+    except ValueError:
+        print("❌ --batch-size needs a positive integer")
+        sys.exit(2)
+
+    json_output = '--json' in args
+    if json_output:
+        args.remove('--json')
+
+    # End-to-end tests check RUN_E2E; workers inherit the environment
+    if '--e2e' in args:
+        args.remove('--e2e')
+        os.environ['RUN_E2E'] = '1'
+
+    if '--pytest' in args:
+        args.remove('--pytest')
+        last_failed = '--lf' in args
+        if last_failed:
+            args.remove('--lf')
+        sys.exit(0 if run_with_pytest(args, last_failed) else 1)
+
+    if args:
+        arg = args[0].lower()
 
         if arg in ['help', '--help', '-h']:
             print("University Management System - Test Runner")
@@ -154,9 +686,16 @@ def main():
             print("  python run_tests.py <module>  # Run specific test module")
             print("  python run_tests.py list      # List available test modules")
             print("  python run_tests.py help      # Show this help message")
+            print("\nOptions:")
+            print("  --batch-size N                # Test modules sent to a worker at a time")
+            print("  --json                        # Print a JSON summary; the report goes to stderr")
+            print("  --e2e                         # Also run the end-to-end main() smoke test")
+            print("  --pytest [module ...]         # Run with pytest (parallel with pytest-xdist)")
+            print("  --lf                          # With --pytest, rerun only the last failures")
             print("\nExamples:")
             print("  python run_tests.py person    # Run test_person.py")
             print("  python run_tests.py student   # Run test_student.py")
+            print("  python run_tests.py --pytest student")
             return
 
         elif arg == 'list':
@@ -165,11 +704,11 @@ def main():
 
         else:
             # Run specific test module
-            print(f"Running tests for module: {arg}")
-            success = run_specific_test_module(arg)
+            print(f"Running tests for module: {arg}", file=sys.stderr if json_output else sys.stdout)
+            success = run_specific_test_module(arg, json_output)
     else:
         # Run all tests
-        success = discover_and_run_tests()
+        success = discover_and_run_tests(batch_size, json_output)
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)
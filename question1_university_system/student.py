@@ -12,8 +12,202 @@ Classes:
     SecureStudentRecord: Encapsulated record management with data validation
 """
 
+import logging
+
 from person import Person
 
+# Enrollment messages are logged at INFO level; they are silent unless the
+# application enables them (main.py sends them to stdout)
+log = logging.getLogger(__name__)
+
+# Standard grade point mapping on a 4.0 scale
+_GRADE_POINTS = {'A': 4.0, 'B': 3.0, 'C': 2.0, 'D': 1.0, 'F': 0.0}
+
+# NumPy lookup table indexed by the ASCII code of a grade, built on first use
+# by Student.bulk_calculate_gpa() so NumPy stays an optional dependency
+_GRADE_LUT = None
+
+
+def _grade_lut(np):
+    """
+    Get the 256-entry grade point lookup table, building it if needed.
+
+    Args:
+        np: The imported numpy module
+
+    Returns:
+        numpy.ndarray: Grade points indexed by ASCII code
+    """
+    global _GRADE_LUT
+    if _GRADE_LUT is None:
+        _GRADE_LUT = np.zeros(256, dtype=np.float64)
+        for grade, points in _GRADE_POINTS.items():
+            _GRADE_LUT[ord(grade)] = points
+    return _GRADE_LUT
+
+
+def _grade_point_columns(students, np):
+    """
+    Pack the graded courses of many students into flat NumPy columns.
+
+    Args:
+        students (list): Student objects
+        np: The imported numpy module
+
+    Returns:
+        tuple: (grade points of every graded course, student by student;
+                number of graded courses per student)
+    """
+    # One ASCII byte per graded course, plus how many belong to each student
+    counts = np.empty(len(students), dtype=np.int64)
+    letters = []
+    for i, student in enumerate(students):
+        graded = [grade for grade in student.enrolled_courses.values() if grade in _GRADE_POINTS]
+        counts[i] = len(graded)
+        letters.extend(graded)
+
+    buf = np.frombuffer(''.join(letters).encode('ascii'), dtype=np.uint8)
+    return _grade_lut(np)[buf], counts
+
+
+def _mean_gpas(points, counts, np, kernel=None):
+    """
+    Average the grade point columns per student, rounded like calculate_gpa().
+
+    Args:
+        points (numpy.ndarray): Grade points from _grade_point_columns()
+        counts (numpy.ndarray): Graded courses per student
+        np: The imported numpy module
+        kernel (callable): Optional compiled kernel from _mean_gpa_kernel()
+                           to average the students in parallel
+
+    Returns:
+        numpy.ndarray: GPA per student, 0.0 for students without grades
+    """
+    if kernel is not None:
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        means = kernel(points, offsets)
+    else:
+        owners = np.repeat(np.arange(len(counts)), counts)
+        totals = np.bincount(owners, weights=points, minlength=len(counts))
+        means = np.zeros(len(counts), dtype=np.float64)
+        np.divide(totals, counts, out=means, where=counts > 0)
+
+    # Round with Python's round(), not np.round(): np.round scales by 100
+    # first and can land on the other side of a .xx5 tie (77/40 gives 1.92
+    # instead of 1.93), which would disagree with calculate_gpa()
+    return np.array([round(mean, 2) for mean in means.tolist()], dtype=np.float64)
+
+
+# Academic statuses in the order of the codes used by the bulk classifier
+_STATUSES = ("Dean's List", "Good Standing", "Probation")
+
+# Numba-compiled per-student grade point averager, or False when Numba is
+# not installed; None until Student.bulk_academic_status() first needs it
+_gpa_kernel = None
+
+
+def _mean_gpa_kernel():
+    """
+    Get the Numba-compiled grade point averager, compiling it once.
+
+    The kernel takes the flat grade points and per-student offsets into
+    them and returns each student's unrounded mean, averaging students in
+    parallel across cores with prange. Rounding is left to _mean_gpas() so
+    the result matches calculate_gpa() exactly.
+
+    Returns:
+        callable: The compiled kernel, or None if Numba is not installed
+    """
+    global _gpa_kernel
+    if _gpa_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _gpa_kernel = False
+        else:
+            import numpy as np
+
+            @njit(parallel=True)
+            def kernel(points, offsets):
+                means = np.zeros(len(offsets) - 1, np.float64)
+                for i in prange(len(offsets) - 1):
+                    start, end = offsets[i], offsets[i + 1]
+                    if end > start:
+                        means[i] = points[start:end].sum() / (end - start)
+                return means
+
+            _gpa_kernel = kernel
+    return _gpa_kernel or None
+
+
+class _GradeBook(dict):
+    """
+    Dictionary of course_id to grade that keeps its student's caches honest.
+
+    Every mutation marks the owning student's cached GPA as stale, so
+    grades written straight into enrolled_courses are picked up by the
+    next calculate_gpa() call. Removing a course also clears the student's
+    prerequisite mask, since the mask may no longer be backed by a key;
+    enroll_course() then falls back to checking the keys themselves.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner, courses=()):
+        # dict.__init__ fills the mapping without going through __setitem__
+        super().__init__(courses)
+        self._owner = owner
+
+    def __reduce__(self):
+        return (self.__class__, (self._owner, dict(self)))
+
+    def _changed(self):
+        """Mark the owning student's cached GPA as stale."""
+        self._owner._gpa_dirty = True
+
+    def _removed(self):
+        """Mark the GPA stale and drop the prerequisite mask after a removal."""
+        self._owner._gpa_dirty = True
+        self._owner._completed_mask = 0
+
+    def __setitem__(self, course_id, grade):
+        super().__setitem__(course_id, grade)
+        self._changed()
+
+    def __delitem__(self, course_id):
+        super().__delitem__(course_id)
+        self._removed()
+
+    def __ior__(self, other):
+        super().update(other)
+        self._changed()
+        return self
+
+    def pop(self, *args):
+        grade = super().pop(*args)
+        self._removed()
+        return grade
+
+    def popitem(self):
+        item = super().popitem()
+        self._removed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._removed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, course_id, grade=None):
+        if course_id not in self:
+            self[course_id] = grade
+        return super().__getitem__(course_id)
+
 
 class Student(Person):
     """
@@ -29,6 +223,12 @@ class Student(Person):
         gpa (float): Current Grade Point Average
     """
 
+    # Person already declares its own slots; only student state is added here
+    __slots__ = ('major', '_enrolled_courses', 'gpa', '_gpa_dirty', '_completed_mask')
+
+    # Static responsibilities, built once from the Person base tuple
+    _RESP = Person._BASE_RESP + ("Attend classes and complete coursework.",)
+
     def __init__(self, person_id, name, birth_date, major):
         """
         Initialize a Student with personal and academic information.
@@ -42,8 +242,34 @@ class Student(Person):
         # Initialize base Person attributes
         super().__init__(person_id, name, birth_date)
         self.major = major
-        self.enrolled_courses = {}  # Dictionary mapping course_id to grade
+        self._enrolled_courses = _GradeBook(self)  # Dictionary mapping course_id to grade
         self.gpa = 0.0
+        # calculate_gpa() only recomputes after enrollments or grades change
+        self._gpa_dirty = True
+        # Bits of courses taken through enroll_course(), see Department.finalize()
+        self._completed_mask = 0
+
+    @property
+    def enrolled_courses(self):
+        """
+        Courses the student is enrolled in, mapped to their grades.
+
+        Any change to the dictionary, or replacing it outright, marks the
+        cached GPA as stale. Replacing it, or removing a course from it,
+        also resets the prerequisite mask. Any mapping assigned here is
+        copied, so the student always owns a mutable record whose writes
+        are tracked.
+
+        Returns:
+            dict: Maps course_id to grade (None if no grade yet)
+        """
+        return self._enrolled_courses
+
+    @enrolled_courses.setter
+    def enrolled_courses(self, courses):
+        self._enrolled_courses = _GradeBook(self, courses)
+        self._gpa_dirty = True
+        self._completed_mask = 0
 
     def enroll_course(self, course, department):
         """
@@ -56,21 +282,40 @@ class Student(Person):
             course: Course object to enroll in
             department: Department object (currently unused but kept for interface consistency)
         """
-        # Check if student has completed all prerequisites
-        completed_courses = set(self.enrolled_courses.keys())
-        if not course.prerequisites.issubset(completed_courses):
-            # Calculate which prerequisites are missing
-            missing = course.prerequisites - completed_courses
-            print(f"Enrollment failed: Missing prerequisites for {course.name}: {', '.join(missing)}")
+        # The roster rejects duplicates, so report them rather than "full"
+        if course.course_id in self.enrolled_courses:
+            log.info("Enrollment failed: %s is already enrolled in %s.", self.name, course.name)
+            return
+
+        # Courses without prerequisites (most 100-level ones) skip all checks.
+        # Otherwise take the fast path for courses indexed by
+        # Department.finalize(): a single integer AND. Fall back to the
+        # course's compiled prerequisite check when the course is not indexed
+        # or the mask reports a gap, since courses recorded directly in
+        # enrolled_courses are not in the mask.
+        prereqs = course.prerequisites
+        prereq_mask = course._prereq_mask
+        if (prereqs
+                and (prereq_mask is None or prereq_mask & ~self._completed_mask)
+                and not course.check_prereqs(self.enrolled_courses)):
+            # Calculate which prerequisites are missing, checking them
+            # against the keys view, without copying the keys into a set.
+            # Skipped entirely when nobody is listening for the message.
+            if log.isEnabledFor(logging.INFO):
+                missing = prereqs - self.enrolled_courses.keys()
+                log.info("Enrollment failed: Missing prerequisites for %s: %s",
+                         course.name, ', '.join(missing))
             return
 
         # Attempt to add student to course (handles capacity checking)
         if course.add_student(self):
             # Add course to student's enrolled courses with no grade initially
             self.enrolled_courses[course.course_id] = None
-            print(f"{self.name} enrolled in {course.name}.")
+            self._completed_mask |= course._bit
+            self._gpa_dirty = True
+            log.info("%s enrolled in %s.", self.name, course.name)
         else:
-            print(f"Enrollment failed: {course.name} is full.")
+            log.info("Enrollment failed: %s is full.", course.name)
 
     def drop_course(self, course):
         """
@@ -82,44 +327,136 @@ class Student(Person):
         Args:
             course: Course object to drop
         """
-        if course.course_id in self.enrolled_courses:
-            # Remove student from course enrollment
-            course.remove_student(self)
-            # Remove course from student's enrolled courses
+        # Remove course from student's enrolled courses in a single lookup;
+        # nothing to do if the student was not enrolled. The deletion clears
+        # the whole prerequisite mask, but here the dropped course is known,
+        # so only its bit needs to go.
+        completed_mask = self._completed_mask
+        try:
             del self.enrolled_courses[course.course_id]
-            print(f"{self.name} dropped {course.name}.")
+        except KeyError:
+            return
+
+        # Remove student from course enrollment
+        course.remove_student(self)
+        self._completed_mask = completed_mask & ~course._bit
+        self._gpa_dirty = True
+        log.info("%s dropped %s.", self.name, course.name)
+
+    def set_grade(self, course_id, grade):
+        """
+        Record the grade for a course the student is enrolled in.
+
+        Args:
+            course_id (str): Id of an enrolled course
+            grade (str): Letter grade (A, B, C, D or F), or None to clear it
+
+        Raises:
+            ValueError: If the student is not enrolled in the course or the
+                        grade is not a recognised letter grade
+        """
+        if course_id not in self.enrolled_courses:
+            raise ValueError(f"{self.name} is not enrolled in {course_id}")
+        if grade is not None and grade not in _GRADE_POINTS:
+            raise ValueError(f"Grade must be one of {', '.join(_GRADE_POINTS)}")
+        self.enrolled_courses[course_id] = grade
+        self._gpa_dirty = True
 
     def calculate_gpa(self):
         """
         Calculate and update the student's GPA based on completed courses.
 
         Uses a simplified 4.0 scale with standard letter grade mappings.
-        Only includes courses with assigned grades in the calculation.
+        Only includes courses with assigned grades in the calculation. The
+        result is cached until enrollments or grades change.
 
         Returns:
             float: Calculated GPA rounded to 2 decimal places
         """
-        total_points = 0
-        total_credits = 0  # Note: Using fixed 3 credits per course for simplification
-
-        # Standard grade point mapping
-        grade_points = {'A': 4.0, 'B': 3.0, 'C': 2.0, 'D': 1.0, 'F': 0.0}
+        if not self._gpa_dirty:
+            return self.gpa
+        self._gpa_dirty = False
+
+        # Newly enrolled students have no grades yet; any() stops at the
+        # first grade, so this only scans everything when there is none
+        grades = self.enrolled_courses.values()
+        if not any(grades):
+            self.gpa = 0.0
+            return 0.0
 
-        # Calculate total points and credits for graded courses
-        for course_id, grade in self.enrolled_courses.items():
-            if grade and grade in grade_points:
-                total_points += grade_points[grade] * 3  # Assuming 3 credits per course
-                total_credits += 3
+        # Grade points for graded courses: map() runs the table lookup in C
+        # with a single hash per grade, and ungraded (None) or unknown grades
+        # come back as None. Every course counts a fixed 3 credits, so credit
+        # weighting cancels out and the GPA is a plain mean of grade points.
+        points = [p for p in map(_GRADE_POINTS.get, grades) if p is not None]
 
         # Handle case where no graded courses exist
-        if total_credits == 0:
+        if not points:
             self.gpa = 0.0
             return 0.0
 
         # Calculate and store GPA
-        self.gpa = round(total_points / total_credits, 2)
+        self.gpa = round(sum(points) / len(points), 2)
         return self.gpa
 
+    @classmethod
+    def bulk_calculate_gpa(cls, students):
+        """
+        Calculate and update the GPA of many students in one NumPy pass.
+
+        The graded courses of all students are packed into one byte buffer
+        (structure of arrays), mapped to grade points through a lookup table
+        and summed per student, so the per-grade work happens in NumPy
+        instead of one calculate_gpa() call per student. Averages are rounded
+        with Python's round(), so each student's gpa is updated and cached
+        with the same value calculate_gpa() would give.
+
+        Requires NumPy, which is imported on first use.
+
+        Args:
+            students: Sequence of Student objects
+
+        Returns:
+            numpy.ndarray: GPA per student, aligned with the input order
+        """
+        import numpy as np
+
+        students = list(students)
+        gpas = _mean_gpas(*_grade_point_columns(students, np), np)
+
+        for student, gpa in zip(students, gpas.tolist()):
+            student.gpa = gpa
+            student._gpa_dirty = False
+        return gpas
+
+    @classmethod
+    def bulk_academic_status(cls, students):
+        """
+        Determine the academic status of many students at once.
+
+        Gives the same result as calling get_academic_status() on each
+        student, for registrar-wide reports. When Numba is installed the
+        per-student averages are computed in a compiled kernel spread over
+        every core; otherwise they are a vectorized NumPy computation.
+        Student GPAs are left untouched.
+
+        Requires NumPy; Numba is optional. Both are imported on first use.
+
+        Args:
+            students: Sequence of Student objects
+
+        Returns:
+            list: Academic status string per student, aligned with the input order
+        """
+        import numpy as np
+
+        students = list(students)
+        points, counts = _grade_point_columns(students, np)
+        gpas = _mean_gpas(points, counts, np, _mean_gpa_kernel())
+        codes = np.where(gpas >= 3.5, 0, np.where(gpas >= 2.0, 1, 2))
+
+        return [_STATUSES[code] for code in codes.tolist()]
+
     def get_academic_status(self):
         """
         Determine the student's academic standing based on current GPA.
@@ -142,16 +479,12 @@ class Student(Person):
 
     def get_responsibilities(self):
         """
-        Get the list of responsibilities specific to students.
+        Get the responsibilities specific to students.
 
         Returns:
-            list: List of responsibility strings including academic duties
+            tuple: Responsibility strings including academic duties
         """
-        # Get base responsibilities from Person class
-        base_resp = super().get_responsibilities()
-        # Add student-specific responsibility
-        base_resp.append("Attend classes and complete coursework.")
-        return base_resp
+        return self._RESP
 
 
 class UndergraduateStudent(Student):
@@ -165,6 +498,8 @@ class UndergraduateStudent(Student):
         year_level (int): Current academic year (1=Freshman, 2=Sophomore, etc.)
     """
 
+    __slots__ = ('year_level',)
+
     def __init__(self, person_id, name, birth_date, major, year_level):
         """
         Initialize an UndergraduateStudent.
@@ -192,6 +527,8 @@ class GraduateStudent(Student):
         advisor (str): Name or ID of the faculty advisor
     """
 
+    __slots__ = ('advisor',)
+
     def __init__(self, person_id, name, birth_date, major, advisor):
         """
         Initialize a GraduateStudent.
@@ -222,6 +559,10 @@ class SecureStudentRecord:
         __enrollment_limit: Maximum number of courses a student can take
     """
 
+    # Private names in __slots__ are mangled like attributes, so these
+    # become _SecureStudentRecord__student etc.
+    __slots__ = ('__student', '__gpa', '__enrollment_limit')
+
     def __init__(self, student, initial_gpa=0.0):
         """
         Initialize a SecureStudentRecord for the given student.
@@ -232,21 +573,23 @@ class SecureStudentRecord:
         """
         self.__student = student
         self.__gpa = 0.0  # Initialize to safe default
-        self.set_gpa(initial_gpa)  # Use setter for validation
+        self.gpa = initial_gpa  # Use property setter for validation
         self.__enrollment_limit = 5  # Maximum courses per student
 
-    def get_gpa(self):
+    @property
+    def gpa(self):
         """
-        Getter method for the student's GPA.
+        The student's GPA, validated on assignment.
 
         Returns:
             float: Current GPA value
         """
         return self.__gpa
 
-    def set_gpa(self, new_gpa):
+    @gpa.setter
+    def gpa(self, new_gpa):
         """
-        Setter method for the student's GPA with validation.
+        Set the student's GPA with validation.
 
         Ensures GPA values are within the valid range (0.0 to 4.0).
 
@@ -256,10 +599,30 @@ class SecureStudentRecord:
         Raises:
             ValueError: If GPA is not between 0.0 and 4.0
         """
-        if 0.0 <= new_gpa <= 4.0:
-            self.__gpa = new_gpa
-        else:
+        if not 0.0 <= new_gpa <= 4.0:
             raise ValueError("GPA must be between 0.0 and 4.0")
+        self.__gpa = new_gpa
+
+    def get_gpa(self):
+        """
+        Getter method for the student's GPA, kept for compatibility.
+
+        Returns:
+            float: Current GPA value
+        """
+        return self.__gpa
+
+    def set_gpa(self, new_gpa):
+        """
+        Setter method for the student's GPA, kept for compatibility.
+
+        Args:
+            new_gpa (float): New GPA value to set
+
+        Raises:
+            ValueError: If GPA is not between 0.0 and 4.0
+        """
+        self.gpa = new_gpa
 
     def can_enroll_more(self):
         """
@@ -272,9 +635,19 @@ class SecureStudentRecord:
         """
         return len(self.__student.enrolled_courses) < self.__enrollment_limit
 
+    @property
+    def student_name(self):
+        """
+        The name of the student associated with this secure record.
+
+        Returns:
+            str: Student's name
+        """
+        return self.__student.name
+
     def get_student_name(self):
         """
-        Get the name of the student associated with this secure record.
+        Get the name of the student, kept for compatibility.
 
         Returns:
             str: Student's name
@@ -0,0 +1,17 @@
+"""
+Shared pytest configuration for the test modules.
+
+Makes the application modules (person, student, faculty, department, main)
+importable once for the whole session, instead of every test module
+editing sys.path itself. run_tests.py does the same in _init_worker(),
+and "python -m unittest discover -s test_code -t ." gets it from running
+in the application directory. The test modules are not meant to be run
+as scripts.
+"""
+
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
@@ -7,24 +7,57 @@ and department organization functionality.
 
 import unittest
 import sys
-import os
+import copy
+from functools import lru_cache
 
-# Add the parent directory to the path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from department import Course, Department
+from department import Course, CourseCache, Department
 from student import Student
 
+try:
+    import numpy
+except ImportError:  # NumPy is only needed for the array views
+    numpy = None
+
+
+@lru_cache(maxsize=None)
+def _mk_student(sid, name, dob, major):
+    """
+    Build a Student once per argument set and share it between tests.
+
+    Only use this for students a test never changes; tests that enroll or
+    grade a student must construct a fresh one.
+    """
+    return Student(sid, name, dob, major)
+
+
+@lru_cache(maxsize=None)
+def _mk_course_template(course_id, name, credits, limit=30):
+    """Build an unenrolled Course prototype once per argument set."""
+    return Course(course_id, name, credits, limit=limit)
+
+
+def _mk_course(course_id, name, credits, limit=30):
+    """
+    Get an independent, empty Course cloned from a shared prototype.
+
+    The shallow copy would share the roster dictionary, so each clone gets
+    its own.
+    """
+    course = copy.copy(_mk_course_template(course_id, name, credits, limit))
+    course.students_enrolled = {}
+    return course
+
 
 class TestCourse(unittest.TestCase):
     """Test cases for the Course class."""
 
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.course = Course("CS101", "Intro to Programming", 3, limit=2)
-        self.student1 = Student("S001", "Alice", "2000-01-01", "CS")
-        self.student2 = Student("S002", "Bob", "2000-02-02", "CS")
-        self.student3 = Student("S003", "Charlie", "2000-03-03", "CS")
+        self.course = _mk_course("CS101", "Intro to Programming", 3, limit=2)
+        # Course tests only place students on rosters, so they can be shared
+        self.student1 = _mk_student("S001", "Alice", "2000-01-01", "CS")
+        self.student2 = _mk_student("S002", "Bob", "2000-02-02", "CS")
+        self.student3 = _mk_student("S003", "Charlie", "2000-03-03", "CS")
 
     def test_course_initialization(self):
         """Test course initialization with all parameters."""
@@ -43,18 +76,26 @@ class TestCourse(unittest.TestCase):
         expected_prereqs = {"CS101", "MATH101"}
         self.assertEqual(advanced_course.prerequisites, expected_prereqs)
 
+    def test_numeric_course_ids(self):
+        """Test that non-str course and prerequisite ids are stored as str."""
+        course = Course(201, "Data Structures", 3, prerequisites=[101, "MATH101"])
+
+        self.assertEqual(course.course_id, "201")
+        self.assertEqual(course.prerequisites, {"101", "MATH101"})
+        self.assertTrue(course.check_prereqs({"101": "A", "MATH101": "B"}))
+
     def test_add_student_success(self):
         """Test successful student enrollment within capacity."""
         # Add first student
         result1 = self.course.add_student(self.student1)
         self.assertTrue(result1)
-        self.assertIn(self.student1, self.course.students_enrolled)
+        self.assertIn(self.student1.person_id, self.course.students_enrolled)
         self.assertEqual(len(self.course.students_enrolled), 1)
 
         # Add second student (at capacity)
         result2 = self.course.add_student(self.student2)
         self.assertTrue(result2)
-        self.assertIn(self.student2, self.course.students_enrolled)
+        self.assertIn(self.student2.person_id, self.course.students_enrolled)
         self.assertEqual(len(self.course.students_enrolled), 2)
 
     def test_add_student_capacity_exceeded(self):
@@ -66,18 +107,24 @@ class TestCourse(unittest.TestCase):
         # Try to add third student (should fail)
         result = self.course.add_student(self.student3)
         self.assertFalse(result)
-        self.assertNotIn(self.student3, self.course.students_enrolled)
+        self.assertNotIn(self.student3.person_id, self.course.students_enrolled)
         self.assertEqual(len(self.course.students_enrolled), 2)
 
+    def test_add_student_duplicate(self):
+        """Test that enrolling the same student twice is rejected."""
+        self.assertTrue(self.course.add_student(self.student1))
+        self.assertFalse(self.course.add_student(self.student1))
+        self.assertEqual(len(self.course.students_enrolled), 1)
+
     def test_remove_student_success(self):
         """Test successful student removal from course."""
         # First enroll student
         self.course.add_student(self.student1)
-        self.assertIn(self.student1, self.course.students_enrolled)
+        self.assertIn(self.student1.person_id, self.course.students_enrolled)
 
         # Then remove student
         self.course.remove_student(self.student1)
-        self.assertNotIn(self.student1, self.course.students_enrolled)
+        self.assertNotIn(self.student1.person_id, self.course.students_enrolled)
         self.assertEqual(len(self.course.students_enrolled), 0)
 
     def test_remove_student_not_enrolled(self):
@@ -89,23 +136,98 @@ class TestCourse(unittest.TestCase):
         # Should not change enrollment list
         self.assertEqual(len(self.course.students_enrolled), initial_count)
 
+    def test_remove_not_enrolled_keeps_capacity(self):
+        """Test that removing an unenrolled student does not open a seat."""
+        self.course.add_student(self.student1)
+        self.course.add_student(self.student2)
+        self.course.remove_student(self.student3)
+
+        self.assertFalse(self.course.add_student(self.student3))
+
+    def test_roster_keeps_enrollment_order(self):
+        """Test that the roster is keyed by person_id and iterates in enrollment order."""
+        self.course.add_student(self.student2)
+        self.course.add_student(self.student1)
+
+        self.assertEqual(list(self.course.students_enrolled), ["S002", "S001"])
+        self.assertEqual(list(self.course.students_enrolled.values()), [self.student2, self.student1])
+
+    def test_seat_reopens_after_removal(self):
+        """Test that dropping a student frees a seat for another."""
+        self.course.add_student(self.student1)
+        self.course.add_student(self.student2)
+        self.course.remove_student(self.student3)  # Not enrolled: no seat freed
+        self.assertFalse(self.course.add_student(self.student3))
+
+        self.course.remove_student(self.student1)
+        self.assertTrue(self.course.add_student(self.student3))
+
+    def test_raised_enrollment_limit_opens_seats(self):
+        """Test that capacity follows changes to enrollment_limit."""
+        course = Course("CS999", "Seminar", 1, limit=1)
+        course.enrollment_limit = 3
+
+        results = [course.add_student(s) for s in (self.student1, self.student2, self.student3)]
+        self.assertEqual(results, [True, True, True])
+
     def test_course_string_representation(self):
         """Test the __str__ method returns correct format."""
         expected = "CS101: Intro to Programming (3 credits)"
         self.assertEqual(str(self.course), expected)
 
+        # Reflects later changes to the public attributes
+        course = Course("CS102", "Old Name", 3)
+        str(course)
+        course.name, course.credits = "New Name", 4
+        self.assertEqual(str(course), "CS102: New Name (4 credits)")
+
+    def test_check_prereqs(self):
+        """Test the compiled prerequisite check for each prerequisite shape."""
+        completed = {"CS101": "A", "CS201": None, "MATH101": "B"}
+        shapes = [
+            ([], True),
+            (["CS101"], True),
+            (["CS301"], False),
+            (["CS101", "MATH101"], True),
+            (["CS101", "CS301"], False),
+            (["CS101", "CS201", "MATH101"], True),
+            (["CS101", "CS201", "CS301"], False),
+        ]
+
+        for prerequisites, expected in shapes:
+            with self.subTest(prerequisites=prerequisites):
+                course = Course("CS999", "Check", 3, prerequisites=prerequisites)
+                self.assertEqual(course.check_prereqs(completed), expected)
+
+    def test_identical_prerequisites_shared(self):
+        """Test that courses with the same prerequisites share one set and check."""
+        first = Course("CS301", "Algorithms", 3, prerequisites=["CS101", "CS201"])
+        second = Course("CS302", "Compilers", 3, prerequisites={"CS201", "CS101"})
+
+        self.assertIs(first.prerequisites, second.prerequisites)
+        self.assertIs(first.check_prereqs, second.check_prereqs)
+
+    def test_course_ids_interned(self):
+        """Test that course ids and prerequisite ids are interned."""
+        course_id = "".join(["CS", "401"])
+        prereq_id = "".join(["CS", "301"])
+        course = Course(course_id, "Theory", 3, prerequisites=[prereq_id])
+
+        self.assertIs(course.course_id, sys.intern("CS401"))
+        self.assertIs(next(iter(course.prerequisites)), sys.intern("CS301"))
+
     def test_default_enrollment_limit(self):
         """Test default enrollment limit when not specified."""
         default_course = Course("CS102", "Test Course", 3)
         self.assertEqual(default_course.enrollment_limit, 30)  # Default value
 
     def test_prerequisites_immutability(self):
-        """Test that prerequisites are stored as a set for efficient operations."""
+        """Test that prerequisites are stored as a frozenset for efficient operations."""
         prereq_course = Course("CS301", "Advanced Course", 3, 
                              prerequisites=["CS101", "CS201", "CS101"])  # Duplicate
 
-        # Should be a set (no duplicates)
-        self.assertIsInstance(prereq_course.prerequisites, set)
+        # Should be an immutable set (no duplicates)
+        self.assertIsInstance(prereq_course.prerequisites, frozenset)
         self.assertEqual(len(prereq_course.prerequisites), 2)  # Duplicates removed
 
 
@@ -115,8 +237,8 @@ class TestDepartment(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.department = Department("Computer Science")
-        self.course1 = Course("CS101", "Intro to Programming", 3)
-        self.course2 = Course("CS201", "Data Structures", 3)
+        self.course1 = _mk_course("CS101", "Intro to Programming", 3)
+        self.course2 = _mk_course("CS201", "Data Structures", 3)
 
     def test_department_initialization(self):
         """Test department initialization with empty collections."""
@@ -142,6 +264,13 @@ class TestDepartment(unittest.TestCase):
         self.assertIn("CS101", self.department.courses)
         self.assertIn("CS201", self.department.courses)
 
+    def test_add_courses(self):
+        """Test adding a batch of courses in one call."""
+        self.department.add_courses([self.course1, self.course2])
+
+        self.assertEqual(list(self.department.courses), ["CS101", "CS201"])
+        self.assertIs(self.department.get_course("CS201"), self.course2)
+
     def test_add_faculty(self):
         """Test adding faculty members to department."""
         # Create a mock faculty member (we'll import from faculty module)
@@ -183,6 +312,113 @@ class TestDepartment(unittest.TestCase):
         self.assertEqual(self.department.courses["CS201"].name, "Course 2")
         self.assertEqual(self.department.courses["CS301"].credits, 3)
 
+    def test_finalize_topological_order(self):
+        """Test that finalize orders courses so prerequisites come first."""
+        self.department.add_course(Course("CS301", "Algorithms", 3, prerequisites=["CS201"]))
+        self.department.add_course(Course("CS201", "Data Structures", 3, prerequisites=["CS101"]))
+        self.department.add_course(self.course1)
+
+        order = self.department.finalize()
+
+        self.assertEqual(order, ["CS101", "CS201", "CS301"])
+
+    def test_finalize_prerequisite_masks(self):
+        """Test that finalize gives each course a bitmask of its prerequisites."""
+        advanced = Course("CS301", "Algorithms", 3, prerequisites=["CS101", "MATH101"])
+        self.department.add_course(self.course1)
+        self.department.add_course(advanced)
+
+        self.department.finalize()
+
+        self.assertEqual(self.course1._prereq_mask, 0)
+        self.assertNotEqual(self.course1._bit, 0)
+        # External prerequisites still get a bit of their own
+        self.assertEqual(bin(advanced._prereq_mask).count("1"), 2)
+        self.assertTrue(advanced._prereq_mask & self.course1._bit)
+
+    def test_get_course(self):
+        """Test course lookup by id, including a missing course."""
+        self.department.add_course(self.course1)
+
+        self.assertIs(self.department.get_course("CS101"), self.course1)
+        self.assertIsNone(self.department.get_course("CS999"))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_build_arrays(self):
+        """Test the column-wise course arrays and the aggregates built on them."""
+        small = Course("CS301", "Seminar", 4, limit=2)
+        self.department.add_course(self.course1)
+        self.department.add_course(small)
+        small.add_student(Student("S001", "Alice", "2000-01-01", "CS"))
+
+        self.department.build_arrays()
+
+        self.assertEqual(list(self.department._ids), ["CS101", "CS301"])
+        self.assertEqual(list(self.department._credits), [3, 4])
+        self.assertEqual(list(self.department.seats_remaining()), [30, 1])
+        self.assertEqual(list(self.department.utilization()), [0.0, 0.5])
+
+        # Static columns are rebuilt after the catalog changes
+        self.department.add_course(self.course2)
+        self.assertEqual(len(self.department.seats_remaining()), 3)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_build_arrays_follows_direct_changes(self):
+        """Test the arrays after direct catalog edits, limit changes and zero-seat courses."""
+        self.department.add_course(Course("Y1", "One", 3, limit=2))
+        self.assertEqual(list(self.department.seats_remaining()), [2])
+
+        # Added straight into the public dictionary, bypassing add_course()
+        self.department.courses["Y2"] = Course("Y2", "Two", 3, limit=5)
+        self.assertEqual(list(self.department.seats_remaining()), [2, 5])
+
+        self.department.courses["Y1"].enrollment_limit = 4
+        self.assertEqual(list(self.department.seats_remaining()), [4, 5])
+
+        self.department.courses["Y3"] = Course("Y3", "Closed", 3, limit=0)
+        self.assertEqual(list(self.department.utilization()), [0.0, 0.0, 0.0])
+
+    def test_finalize_cycle_detection(self):
+        """Test that a prerequisite cycle raises ValueError."""
+        self.department.add_course(Course("CS101", "A", 3, prerequisites=["CS201"]))
+        self.department.add_course(Course("CS201", "B", 3, prerequisites=["CS101"]))
+
+        with self.assertRaises(ValueError):
+            self.department.finalize()
+
+
+class TestCourseCache(unittest.TestCase):
+    """Test cases for the CourseCache class."""
+
+    def setUp(self):
+        """Set up a cache of two courses that records every load."""
+        self.loaded = []
+
+        def load(course_id):
+            self.loaded.append(course_id)
+            return Course(course_id, f"Course {course_id}", 3)
+
+        self.cache = CourseCache(load, maxsize=2)
+
+    def test_cache_hit_skips_loader(self):
+        """Test that a cached course is returned without loading it again."""
+        first = self.cache.get_course("CS101")
+        second = self.cache.get_course("CS101")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.loaded, ["CS101"])
+
+    def test_least_recently_used_eviction(self):
+        """Test that the least recently used course is evicted when full."""
+        self.cache.get_course("CS101")
+        self.cache.get_course("CS201")
+        self.cache.get_course("CS101")  # CS201 is now least recently used
+        self.cache.get_course("CS301")
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIn("CS101", self.cache)
+        self.assertNotIn("CS201", self.cache)
+
 
 class TestCourseStudentInteraction(unittest.TestCase):
     """Integration tests for Course-Student interactions."""
@@ -230,6 +466,78 @@ class TestCourseStudentInteraction(unittest.TestCase):
         self.assertFalse(result3)  # Should fail due to capacity
         self.assertEqual(len(self.intro_course.students_enrolled), 2)
 
+    def test_enroll_many(self):
+        """Test batch enrollment with prerequisite filtering and capacity."""
+        department = Department("Computer Science")
+        department.add_course(self.intro_course)
+        department.add_course(self.advanced_course)
+        department.finalize()
+
+        student3 = Student("S003", "Charlie", "2000-03-03", "CS")
+        self.student2.enroll_course(self.intro_course, department)
+        student3.enrolled_courses["CS101"] = "B"  # Recorded outside enroll_course
+
+        # Alice lacks CS101; Bob and Charlie fill the two seats
+        admitted = department.enroll_many("CS201", [self.student1, self.student2, student3])
+
+        self.assertEqual(admitted, [self.student2, student3])
+        self.assertEqual(list(self.advanced_course.students_enrolled), ["S002", "S003"])
+        self.assertIn("CS201", student3.enrolled_courses)
+        self.assertNotIn("CS201", self.student1.enrolled_courses)
 
-if __name__ == '__main__':
-    unittest.main()
+        # Course is now full
+        self.assertEqual(department.enroll_many("CS201", [self.student1]), [])
+
+    def test_enroll_many_skips_roster_and_duplicates(self):
+        """Test that batch enrollment never gives one person two seats."""
+        department = Department("Computer Science")
+        department.add_course(self.intro_course)
+        department.finalize()
+
+        # Already on the roster without a matching enrolled_courses entry
+        self.intro_course.add_student(self.student1)
+        self.assertEqual(department.enroll_many("CS101", [self.student1]), [])
+        self.assertEqual(len(self.intro_course.students_enrolled), 1)
+
+        # Two records sharing a person_id only take one seat
+        twin = Student("S002", "Bob", "2000-02-02", "CS")
+        admitted = department.enroll_many("CS101", [self.student2, twin])
+
+        self.assertEqual(admitted, [self.student2])
+        self.assertNotIn("CS101", twin.enrolled_courses)
+        self.assertEqual(len(self.intro_course.students_enrolled), 2)
+        late = Student("S003", "Charlie", "2000-03-03", "CS")
+        self.assertEqual(department.enroll_many("CS101", [late]), [])
+
+    def test_finalized_prerequisite_enforcement(self):
+        """Test enrollment through the bitmask path after Department.finalize()."""
+        department = Department("Computer Science")
+        department.add_course(self.intro_course)
+        department.add_course(self.advanced_course)
+        department.finalize()
+
+        # Missing prerequisite is rejected
+        self.student1.enroll_course(self.advanced_course, department)
+        self.assertNotIn("CS201", self.student1.enrolled_courses)
+
+        # Taking the prerequisite satisfies the mask check
+        self.student1.enroll_course(self.intro_course, department)
+        self.student1.enroll_course(self.advanced_course, department)
+        self.assertIn("CS201", self.student1.enrolled_courses)
+
+        # Dropping the prerequisite clears its bit again
+        self.student1.drop_course(self.intro_course)
+        self.assertFalse(self.student1._completed_mask & self.intro_course._bit)
+
+    def test_finalized_prerequisite_removed_directly(self):
+        """Test that a prerequisite removed from enrolled_courses no longer counts."""
+        department = Department("Computer Science")
+        department.add_course(self.intro_course)
+        department.add_course(self.advanced_course)
+        department.finalize()
+
+        self.student1.enroll_course(self.intro_course, department)
+        self.student1.enrolled_courses.pop("CS101")  # Bypasses drop_course()
+
+        self.student1.enroll_course(self.advanced_course, department)
+        self.assertNotIn("CS201", self.student1.enrolled_courses)
@@ -6,22 +6,38 @@ responsibility management, and inheritance hierarchy.
 """
 
 import unittest
-import sys
-import os
-
-# Add the parent directory to the path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functools import lru_cache
 
 from faculty import Faculty, Professor, Lecturer, TA
 from department import Course
 
 
+@lru_cache(maxsize=None)
+def shared_faculty_members():
+    """
+    Build one Professor, Lecturer and TA once per process.
+
+    The members are only read by the tests, so every test class can share
+    the same objects.
+
+    Returns:
+        tuple: Professor, Lecturer and TA (assisting TEST101)
+    """
+    course = Course("TEST101", "Test Course", 3)
+    return (
+        Professor("P001", "Prof Test", "1970-01-01", "Test Dept"),
+        Lecturer("L001", "Lect Test", "1975-01-01", "Test Dept"),
+        TA("TA001", "TA Test", "1990-01-01", "Test Dept", course),
+    )
+
+
 class TestFaculty(unittest.TestCase):
     """Test cases for the base Faculty class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.faculty = Faculty("F001", "Dr. Smith", "1970-03-15", "Computer Science", "Associate Professor")
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        cls.faculty = Faculty("F001", "Dr. Smith", "1970-03-15", "Computer Science", "Associate Professor")
 
     def test_faculty_initialization(self):
         """Test that Faculty objects are initialized correctly."""
@@ -49,13 +65,34 @@ class TestFaculty(unittest.TestCase):
         # Should have at least 2 responsibilities
         self.assertGreaterEqual(len(responsibilities), 2)
 
+    def test_department_and_rank_interned(self):
+        """Test that equal department and rank strings share one object."""
+        # Build the strings at runtime so they are not compile-time constants
+        other = Faculty("F002", "Dr. Jones", "1972-04-01",
+                        "".join(["Computer ", "Science"]), "".join(["Associate ", "Professor"]))
+
+        self.assertIs(other.department, self.faculty.department)
+        self.assertIs(other.rank, self.faculty.rank)
+
+    def test_non_str_department_and_rank(self):
+        """Test that non-str department and rank values are stored as str."""
+        faculty = Faculty("F003", "Dr. Lee", "1975-02-02", 42, 3)
+
+        self.assertEqual(faculty.department, "42")
+        self.assertEqual(faculty.rank, "3")
+
 
 class TestProfessor(unittest.TestCase):
     """Test cases for the Professor class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        cls.professor = Professor("P001", "Ada Lovelace", "1815-12-10", "Computer Science")
+
     def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.professor = Professor("P001", "Ada Lovelace", "1815-12-10", "Computer Science")
+        """Reset the one attribute a test changes on the shared professor."""
+        self.professor.tenured = False
 
     def test_professor_initialization(self):
         """Test professor initialization with correct rank and tenure status."""
@@ -84,9 +121,10 @@ class TestProfessor(unittest.TestCase):
 class TestLecturer(unittest.TestCase):
     """Test cases for the Lecturer class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.lecturer = Lecturer("L001", "Grace Hopper", "1906-12-09", "Computer Science")
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        cls.lecturer = Lecturer("L001", "Grace Hopper", "1906-12-09", "Computer Science")
 
     def test_lecturer_initialization(self):
         """Test lecturer initialization with correct rank."""
@@ -114,14 +152,22 @@ class TestLecturer(unittest.TestCase):
         # Should NOT include research responsibility (overridden)
         self.assertNotIn("Conduct research and publish findings.", responsibilities)
 
+    def test_lecturer_responsibilities_shared(self):
+        """Test that lecturers share one immutable responsibilities tuple."""
+        other = Lecturer("L002", "Katherine Johnson", "1918-08-26", "Mathematics")
+
+        self.assertIsInstance(self.lecturer.get_responsibilities(), tuple)
+        self.assertIs(self.lecturer.get_responsibilities(), other.get_responsibilities())
+
 
 class TestTA(unittest.TestCase):
     """Test cases for the Teaching Assistant class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.course = Course("CS101", "Intro to Programming", 3)
-        self.ta = TA("TA001", "John Student", "1995-09-20", "Computer Science", self.course)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        cls.course = Course("CS101", "Intro to Programming", 3)
+        cls.ta = TA("TA001", "John Student", "1995-09-20", "Computer Science", cls.course)
 
     def test_ta_initialization(self):
         """Test TA initialization with assisting course."""
@@ -151,33 +197,23 @@ class TestTA(unittest.TestCase):
 class TestFacultyInheritance(unittest.TestCase):
     """Test cases for faculty inheritance hierarchy."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        cls.faculty_members = shared_faculty_members()
+
     def test_all_faculty_inherit_from_faculty(self):
         """Test that all faculty types properly inherit from Faculty base class."""
-        course = Course("TEST101", "Test Course", 3)
-
-        professor = Professor("P001", "Prof Test", "1970-01-01", "Test Dept")
-        lecturer = Lecturer("L001", "Lect Test", "1975-01-01", "Test Dept")
-        ta = TA("TA001", "TA Test", "1990-01-01", "Test Dept", course)
-
-        faculty_members = [professor, lecturer, ta]
-
-        for faculty_member in faculty_members:
-            self.assertIsInstance(faculty_member, Faculty)
-            self.assertTrue(hasattr(faculty_member, 'calculate_workload'))
-            self.assertTrue(hasattr(faculty_member, 'get_responsibilities'))
+        # calculate_workload/get_responsibilities come with the Faculty base
+        # class and are exercised by test_faculty_polymorphism
+        for faculty_member in self.faculty_members:
+            with self.subTest(faculty=faculty_member.TYPE_NAME):
+                self.assertIsInstance(faculty_member, Faculty)
 
     def test_faculty_polymorphism(self):
         """Test polymorphic behavior across different faculty types."""
-        course = Course("TEST101", "Test Course", 3)
-
-        faculty_members = [
-            Professor("P001", "Prof Test", "1970-01-01", "Test Dept"),
-            Lecturer("L001", "Lect Test", "1975-01-01", "Test Dept"),
-            TA("TA001", "TA Test", "1990-01-01", "Test Dept", course)
-        ]
-
         # All should respond to calculate_workload() but with different results
-        workloads = [faculty.calculate_workload() for faculty in faculty_members]
+        workloads = [faculty.calculate_workload() for faculty in self.faculty_members]
 
         # Each workload should be different and non-empty
         self.assertEqual(len(set(workloads)), 3)  # All unique
@@ -185,6 +221,8 @@ class TestFacultyInheritance(unittest.TestCase):
             self.assertIsInstance(workload, str)
             self.assertGreater(len(workload), 0)
 
-
-if __name__ == '__main__':
-    unittest.main()
+        # All should share the responsibilities interface as well
+        for faculty in self.faculty_members:
+            responsibilities = faculty.get_responsibilities()
+            self.assertIsInstance(responsibilities, tuple)
+            self.assertGreater(len(responsibilities), 0)
@@ -8,47 +8,45 @@ polymorphic behavior demonstrations.
 
 import unittest
 from unittest.mock import patch
+from contextlib import redirect_stdout
+from types import MappingProxyType
 import io
-import sys
+import logging
 import os
 
-# Add the parent directory to the path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from main import main
 from person import Staff
 from student import UndergraduateStudent, SecureStudentRecord
 from faculty import Professor, Lecturer
 from department import Department, Course
 
+# Read-only grade records for the GPA workflow, built once at import;
+# tests assign dict() copies so each student owns a mutable record
+_GRADES_DEANS_LIST = MappingProxyType({"CS101": "A", "CS201": "A", "MATH101": "B"})
+_GRADES_PROBATION = MappingProxyType({"CS101": "D", "CS201": "F"})
 
-class TestMainIntegration(unittest.TestCase):
-    """Integration tests for the main application workflow."""
+# Ungraded courses that fill a student up to the secure record's limit of 5
+_FILLER_COURSES = {f"CS{100 + i}": None for i in range(5)}
 
-    def setUp(self):
-        """Set up test fixtures for integration testing."""
-        # Capture stdout to test print statements
-        self.held, sys.stdout = sys.stdout, io.StringIO()
 
-    def tearDown(self):
-        """Clean up after each test."""
-        sys.stdout = self.held
+@unittest.skipUnless(os.environ.get('RUN_E2E'), "end-to-end smoke test; set RUN_E2E=1 to run")
+class TestMainIntegration(unittest.TestCase):
+    """
+    End-to-end smoke test of the main application workflow.
 
-    def test_main_execution_completes(self):
-        """Test that main() executes without errors."""
-        try:
-            main()
-            execution_successful = True
-        except Exception:
-            execution_successful = False
+    Runs the whole demo, so it is skipped in the everyday test loop and
+    enabled with RUN_E2E=1 (python run_tests.py --e2e).
+    """
 
-        self.assertTrue(execution_successful)
+    def test_main_output_content(self):
+        """Test that main() runs to completion and produces the expected output."""
+        # Imported here so collecting this module does not load the demo
+        from main import main
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_main_output_content(self, mock_stdout):
-        """Test that main() produces expected output content."""
-        main()
-        output = mock_stdout.getvalue()
+        # Any exception from main() fails the test, so no separate
+        # "completes without errors" run of the demo is needed
+        with redirect_stdout(io.StringIO()) as captured:
+            main()
+        output = captured.getvalue()
 
         # Check for key sections in output
         self.assertIn("University Management System", output)
@@ -59,6 +57,25 @@ class TestMainIntegration(unittest.TestCase):
         self.assertIn("Workload:", output)
 
 
+class TestMainLogging(unittest.TestCase):
+    """Test that main() leaves the student logger as it found it."""
+
+    def test_logger_restored_on_error(self):
+        """Test that the stdout handler is removed even when the demo fails."""
+        from main import main
+
+        student_log = logging.getLogger("student")
+        handlers, level = list(student_log.handlers), student_log.level
+
+        with patch.object(Department, 'finalize', side_effect=RuntimeError("boom")), \
+                redirect_stdout(io.StringIO()):
+            with self.assertRaises(RuntimeError):
+                main()
+
+        self.assertEqual(student_log.handlers, handlers)
+        self.assertEqual(student_log.level, level)
+
+
 class TestSystemIntegration(unittest.TestCase):
     """Test complete system integration with realistic scenarios."""
 
@@ -95,11 +112,7 @@ class TestSystemIntegration(unittest.TestCase):
         student = UndergraduateStudent("S001", "Test Student", "2000-01-01", "CS", 3)
 
         # Test with high GPA (Dean's List)
-        student.enrolled_courses = {
-            "CS101": "A",
-            "CS201": "A",
-            "MATH101": "B"
-        }
+        student.enrolled_courses = dict(_GRADES_DEANS_LIST)
 
         gpa = student.calculate_gpa()
         status = student.get_academic_status()
@@ -108,10 +121,7 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertEqual(status, "Dean's List")
 
         # Test with low GPA (Probation)
-        student.enrolled_courses = {
-            "CS101": "D",
-            "CS201": "F"
-        }
+        student.enrolled_courses = dict(_GRADES_PROBATION)
 
         gpa = student.calculate_gpa()
         status = student.get_academic_status()
@@ -119,26 +129,6 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertEqual(gpa, 0.5)  # (1+0)/2
         self.assertEqual(status, "Probation")
 
-    def test_faculty_polymorphism(self):
-        """Test polymorphic behavior across different faculty types."""
-        course = Course("CS101", "Test Course", 3)
-
-        # Create different faculty types
-        faculty_members = [
-            Professor("P001", "Dr. Professor", "1970-01-01", "CS"),
-            Lecturer("L001", "Ms. Lecturer", "1975-01-01", "CS"),
-        ]
-
-        # Test that all respond to common interface
-        for faculty in faculty_members:
-            workload = faculty.calculate_workload()
-            responsibilities = faculty.get_responsibilities()
-
-            self.assertIsInstance(workload, str)
-            self.assertGreater(len(workload), 0)
-            self.assertIsInstance(responsibilities, list)
-            self.assertGreater(len(responsibilities), 0)
-
     def test_secure_record_encapsulation(self):
         """Test encapsulation principles with SecureStudentRecord."""
         student = UndergraduateStudent("S001", "Test Student", "2000-01-01", "CS", 2)
@@ -157,8 +147,7 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertTrue(secure_record.can_enroll_more())
 
         # Fill up courses
-        for i in range(5):
-            student.enrolled_courses[f"CS{100+i}"] = None
+        student.enrolled_courses.update(_FILLER_COURSES)
 
         self.assertFalse(secure_record.can_enroll_more())
 
@@ -173,8 +162,7 @@ class TestSystemIntegration(unittest.TestCase):
             Course("CS301", "Algorithms", 3)
         ]
 
-        for course in courses:
-            dept.add_course(course)
+        dept.add_courses(courses)
 
         self.assertEqual(len(dept.courses), 3)
 
@@ -212,7 +200,7 @@ class TestSystemIntegration(unittest.TestCase):
         # Verify interactions worked
         self.assertIn(course.course_id, dept.courses)
         self.assertIn(professor, dept.faculty)
-        self.assertIn(student, course.students_enrolled)
+        self.assertIn(student.person_id, course.students_enrolled)
         self.assertEqual(student.enrolled_courses["CS101"], "A")
 
 
@@ -228,10 +216,12 @@ class TestErrorHandling(unittest.TestCase):
         valid_gpas = [0.0, 4.0, 2.5]
         invalid_gpas = [-0.1, 4.1, -1.0, 10.0]
 
-        # Valid GPAs should work
+        # Valid GPAs should work; gather the round trips and compare once
+        results = []
         for gpa in valid_gpas:
             secure_record.set_gpa(gpa)
-            self.assertEqual(secure_record.get_gpa(), gpa)
+            results.append(secure_record.get_gpa())
+        self.assertEqual(results, valid_gpas)
 
         # Invalid GPAs should raise ValueError
         for gpa in invalid_gpas:
@@ -260,8 +250,3 @@ class TestErrorHandling(unittest.TestCase):
         # Now second student should be able to enroll
         result3 = course.add_student(students[1])
         self.assertTrue(result3)
-
-
-if __name__ == '__main__':
-    # Run all tests with verbose output
-    unittest.main(verbosity=2)
@@ -8,21 +8,31 @@ age calculation, responsibility management, and inheritance behavior.
 import unittest
 from unittest.mock import patch
 import datetime
-import sys
-import os
-
-# Add the parent directory to the path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from person import Person, Staff
 
 
+class _FrozenDate(datetime.date):
+    """A date whose today() is fixed, so age tests do not depend on the clock."""
+
+    @classmethod
+    def today(cls):
+        return cls(2024, 4, 1)
+
+
 class TestPerson(unittest.TestCase):
     """Test cases for the base Person class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.person = Person("P001", "John Doe", "1990-05-15")
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        # datetime.date is a built-in type whose attributes cannot be patched,
+        # so swap the date class the person module uses, once for the class
+        patcher = patch('person._date', _FrozenDate)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+        cls.person = Person("P001", "John Doe", "1990-05-15")
 
     def test_person_initialization(self):
         """Test that Person objects are initialized correctly."""
@@ -32,24 +42,43 @@ class TestPerson(unittest.TestCase):
 
     def test_get_age_calculation(self):
         """Test age calculation with different birth dates."""
-        # Mock today's date to ensure consistent testing
-        with patch('datetime.date.today') as mock_today:
-            mock_today.return_value = datetime.date(2024, 1, 1)
+        # Today is fixed at 2024-04-01 by setUpClass
+        # Test person born before birthday this year
+        person_before = Person("P002", "Jane Smith", "1990-03-15")
+        self.assertEqual(person_before.get_age(), 34)  # Had birthday already
 
-            # Test person born before birthday this year
-            person_before = Person("P002", "Jane Smith", "1990-03-15")
-            self.assertEqual(person_before.get_age(), 34)  # Had birthday already
+        # Test person born after birthday this year
+        person_after = Person("P003", "Bob Johnson", "1990-06-15")
+        self.assertEqual(person_after.get_age(), 33)  # Birthday not yet reached
 
-            # Test person born after birthday this year
-            person_after = Person("P003", "Bob Johnson", "1990-06-15")
-            self.assertEqual(person_after.get_age(), 33)  # Birthday not yet reached
+    def test_invalid_birth_date(self):
+        """Test that a malformed birth date is rejected at construction."""
+        with self.assertRaises(ValueError):
+            Person("P004", "No Date", "15/05/1990")
 
     def test_get_responsibilities(self):
         """Test that base responsibilities are returned correctly."""
         responsibilities = self.person.get_responsibilities()
-        self.assertIsInstance(responsibilities, list)
+        self.assertIsInstance(responsibilities, tuple)
         self.assertIn("Adhere to university policies.", responsibilities)
 
+    def test_type_name(self):
+        """Test that each class carries its own TYPE_NAME."""
+        self.assertEqual(self.person.TYPE_NAME, "Person")
+        self.assertEqual(Staff.TYPE_NAME, "Staff")
+
+    def test_declared_type_name_kept(self):
+        """Test that a subclass can declare its own TYPE_NAME."""
+        class Visitor(Person):
+            __slots__ = ()
+            TYPE_NAME = "Campus Visitor"
+
+        class Guest(Visitor):
+            __slots__ = ()
+
+        self.assertEqual(Visitor.TYPE_NAME, "Campus Visitor")
+        self.assertEqual(Guest.TYPE_NAME, "Guest")
+
     def test_string_representation(self):
         """Test the __str__ method returns correct format."""
         expected = "John Doe (ID: P001)"
@@ -59,9 +88,10 @@ class TestPerson(unittest.TestCase):
 class TestStaff(unittest.TestCase):
     """Test cases for the Staff class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.staff = Staff("ST001", "Alice Brown", "1985-08-20", "IT", "Administrator")
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        cls.staff = Staff("ST001", "Alice Brown", "1985-08-20", "IT", "Administrator")
 
     def test_staff_initialization(self):
         """Test that Staff objects inherit from Person and add staff-specific attributes."""
@@ -74,6 +104,14 @@ class TestStaff(unittest.TestCase):
         self.assertEqual(self.staff.department, "IT")
         self.assertEqual(self.staff.role, "Administrator")
 
+    def test_staff_non_str_department_and_role(self):
+        """Test that non-str department and role values are stored as str."""
+        staff = Staff("ST002", "Sam Green", "1990-01-01", 7, 1)
+
+        self.assertEqual(staff.department, "7")
+        self.assertEqual(staff.role, "1")
+        self.assertIn("Perform 1 duties for the 7 department.", staff.get_responsibilities())
+
     def test_staff_inheritance(self):
         """Test that Staff is properly inheriting from Person."""
         self.assertIsInstance(self.staff, Person)
@@ -93,7 +131,3 @@ class TestStaff(unittest.TestCase):
 
         # Should have at least 2 responsibilities
         self.assertGreaterEqual(len(responsibilities), 2)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Unit Tests for the Test Runner
+
+Tests the worker pool used by run_tests.discover_and_run_tests() against a
+small throwaway suite, including batches whose worker process dies, and the
+in-process fallback.
+"""
+
+import unittest
+from unittest.mock import patch
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+import run_tests
+
+# Fixture modules written into a temporary test directory; names are unique
+# so they cannot clash with the real test modules in sys.modules
+_PASSING_MODULE = '''
+import unittest
+
+
+class T(unittest.TestCase):
+    def test_ok(self):
+        self.assertTrue(True)
+'''
+_CRASHING_MODULE = '''
+import os
+import unittest
+
+
+class T(unittest.TestCase):
+    def test_worker_dies(self):
+        os._exit(3)
+'''
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test cases for the multiprocessing path of discover_and_run_tests()."""
+
+    def setUp(self):
+        """Create an empty test directory and remember the import state."""
+        # Daemonic processes (such as run_tests.py's own workers) cannot
+        # start the child processes these tests need
+        if multiprocessing.current_process().daemon:
+            self.skipTest("cannot start worker processes from a daemonic process")
+        self.test_dir = tempfile.mkdtemp()
+        self.saved_path = list(sys.path)
+        self.modules = []
+
+    def tearDown(self):
+        """Remove the fixture modules and restore the import state."""
+        for name in self.modules:
+            sys.modules.pop(name, None)
+        sys.path[:] = self.saved_path
+        shutil.rmtree(self.test_dir)
+
+    def _write_module(self, name, source):
+        """Write one fixture test module into the temporary directory."""
+        with open(os.path.join(self.test_dir, f"{name}.py"), 'w') as module_file:
+            module_file.write(source)
+        self.modules.append(name)
+
+    def _run(self, cores, batch_size=None):
+        """
+        Run the fixture suite with the timing gate forced open.
+
+        Returns:
+            tuple: (success flag, JSON summary, human-readable report)
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch.object(run_tests, '_TEST_CODE_DIR', Path(self.test_dir)), \
+                patch.object(run_tests, 'PARALLEL_MIN_SECONDS', 0), \
+                patch.object(run_tests, 'cpu_count', lambda: cores), \
+                redirect_stdout(stdout), redirect_stderr(stderr):
+            success = run_tests.discover_and_run_tests(batch_size, json_output=True)
+        return success, json.loads(stdout.getvalue()), stderr.getvalue()
+
+    def test_pool_runs_every_batch(self):
+        """Test that batches run in workers are merged into one summary."""
+        for name in ('test_pool_fixture_a', 'test_pool_fixture_b', 'test_pool_fixture_c'):
+            self._write_module(name, _PASSING_MODULE)
+
+        success, summary, _ = self._run(cores=2, batch_size=1)
+
+        self.assertTrue(success)
+        self.assertEqual(summary['run'], 3)
+        self.assertEqual(summary['errors'], [])
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_dead_worker_reported_as_error(self):
+        """Test that a worker dying mid-batch fails the run without hiding other batches."""
+        self._write_module('test_pool_fixture_a', _PASSING_MODULE)
+        self._write_module('test_pool_fixture_b', _PASSING_MODULE)
+        self._write_module('test_pool_fixture_z', _CRASHING_MODULE)
+
+        success, summary, report = self._run(cores=2, batch_size=1)
+
+        self.assertFalse(success)
+        self.assertEqual(summary['run'], 2)
+        self.assertEqual([error['test'] for error in summary['errors']],
+                         ['batch [test_pool_fixture_z]'])
+        self.assertIn("exit code 3", summary['errors'][0]['traceback'])
+        self.assertIn("ERROR: batch [test_pool_fixture_z]", report)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_failed_warmup_reported_as_error(self):
+        """Test that workers whose warm-up import fails are stopped and reported."""
+        self._write_module('test_pool_fixture_a', _PASSING_MODULE)
+        self._write_module('test_pool_fixture_b', _PASSING_MODULE)
+
+        with patch.object(run_tests, 'WARMUP_MODULES', ('no_such_module_for_warmup',)):
+            success, summary, _ = self._run(cores=2)
+
+        self.assertFalse(success)
+        self.assertEqual(summary['run'], 1)  # Only the in-process first module
+        tests = [error['test'] for error in summary['errors']]
+        self.assertIn('batch [__import_warmup__]', tests)
+        self.assertIn('batch [test_pool_fixture_b]', tests)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_single_core_runs_in_process(self):
+        """Test that one core keeps the run in-process and flags an ignored --batch-size."""
+        self._write_module('test_pool_fixture_a', _PASSING_MODULE)
+        self._write_module('test_pool_fixture_b', _PASSING_MODULE)
+
+        with patch.object(run_tests, '_start_workers') as start_workers:
+            success, summary, report = self._run(cores=1, batch_size=1)
+
+        self.assertTrue(success)
+        self.assertEqual(summary['run'], 2)
+        start_workers.assert_not_called()
+        self.assertIn("--batch-size 1 ignored", report)
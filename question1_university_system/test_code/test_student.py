@@ -6,28 +6,69 @@ academic status determination, and secure record management.
 """
 
 import unittest
-from unittest.mock import MagicMock
-import sys
-import os
-
-# Add the parent directory to the path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import patch
+from types import MappingProxyType
 
 from student import Student, UndergraduateStudent, GraduateStudent, SecureStudentRecord
 from department import Course
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _recording_stub(result=None):
+    """
+    Build a plain stand-in for a Course method, lighter than a MagicMock.
+
+    Args:
+        result: Value the stub returns
+
+    Returns:
+        tuple: (function to patch onto Course, list of students it was called with)
+    """
+    calls = []
+
+    def stub(course, student):
+        calls.append(student)
+        return result
+
+    return stub, calls
+
+
+# Read-only grade records for the GPA tests, built once at import;
+# tests assign dict() copies so each student owns a mutable record
+_GPA_ABC = MappingProxyType({
+    "CS101": "A",  # 4.0 * 3 = 12 points
+    "CS201": "B",  # 3.0 * 3 = 9 points
+    "CS301": "C"   # 2.0 * 3 = 6 points
+})  # Total: 27 points, 9 credits, GPA = 3.0
+_GPA_UNGRADED = MappingProxyType({"CS101": None})
+_GRADES_A = MappingProxyType({"CS101": "A"})  # GPA = 4.0
+_GRADES_C = MappingProxyType({"CS101": "C"})  # GPA = 2.0
+_GRADES_F = MappingProxyType({"CS101": "F"})  # GPA = 0.0
+
+# Five ungraded courses, enough to reach SecureStudentRecord's enrollment limit
+_FILLER_COURSES = {f"CS{100 + i}": None for i in range(5)}
+
 
 class TestStudent(unittest.TestCase):
     """Test cases for the base Student class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in this class."""
+        # Courses for testing; tests patch Course.add_student/remove_student
+        # instead of changing their rosters, so they can be shared
+        cls.course1 = Course("CS101", "Intro to Programming", 3)
+        cls.course2 = Course("CS201", "Data Structures", 3, prerequisites={"CS101"})
+
     def setUp(self):
         """Set up test fixtures before each test method."""
+        # Tests change the student's enrollments, so it is built per test
         self.student = Student("S001", "Alan Turing", "1912-06-23", "Computer Science")
 
-        # Create mock courses for testing
-        self.course1 = Course("CS101", "Intro to Programming", 3)
-        self.course2 = Course("CS201", "Data Structures", 3, prerequisites={"CS101"})
-
     def test_student_initialization(self):
         """Test that Student objects are initialized correctly."""
         self.assertEqual(self.student.person_id, "S001")
@@ -39,26 +80,37 @@ class TestStudent(unittest.TestCase):
     def test_enroll_course_success(self):
         """Test successful course enrollment without prerequisites."""
         # Mock the course's add_student method to return True (successful enrollment)
-        self.course1.add_student = MagicMock(return_value=True)
-
-        self.student.enroll_course(self.course1, None)
+        # Course uses __slots__, so methods are patched on the class
+        add_student, calls = _recording_stub(True)
+        with patch.object(Course, 'add_student', add_student):
+            self.student.enroll_course(self.course1, None)
 
         # Verify student was added to course
-        self.course1.add_student.assert_called_once_with(self.student)
+        self.assertEqual(calls, [self.student])
 
         # Verify course was added to student's enrolled courses
         self.assertIn("CS101", self.student.enrolled_courses)
         self.assertIsNone(self.student.enrolled_courses["CS101"])  # No grade yet
 
+    def test_enroll_course_logs_message(self):
+        """Test that enrollment outcomes are logged rather than printed."""
+        with patch.object(Course, 'add_student', _recording_stub(True)[0]), \
+                self.assertLogs('student', level='INFO') as logs:
+            self.student.enroll_course(self.course1, None)
+            self.student.enroll_course(self.course2, None)
+
+        self.assertEqual(logs.output[0], "INFO:student:Alan Turing enrolled in Intro to Programming.")
+        self.assertEqual(len(logs.output), 2)
+
     def test_enroll_course_prerequisite_failure(self):
         """Test enrollment failure due to missing prerequisites."""
         # Mock the course's add_student method (shouldn't be called)
-        self.course2.add_student = MagicMock(return_value=True)
-
-        self.student.enroll_course(self.course2, None)
+        add_student, calls = _recording_stub(True)
+        with patch.object(Course, 'add_student', add_student):
+            self.student.enroll_course(self.course2, None)
 
         # Verify add_student was not called due to prerequisite failure
-        self.course2.add_student.assert_not_called()
+        self.assertEqual(calls, [])
 
         # Verify course was not added to student's enrolled courses
         self.assertNotIn("CS201", self.student.enrolled_courses)
@@ -66,36 +118,49 @@ class TestStudent(unittest.TestCase):
     def test_enroll_course_capacity_failure(self):
         """Test enrollment failure due to course being full."""
         # Mock the course's add_student method to return False (course full)
-        self.course1.add_student = MagicMock(return_value=False)
-
-        self.student.enroll_course(self.course1, None)
+        with patch.object(Course, 'add_student', _recording_stub(False)[0]):
+            self.student.enroll_course(self.course1, None)
 
         # Verify course was not added to student's enrolled courses
         self.assertNotIn("CS101", self.student.enrolled_courses)
 
+    def test_enroll_course_already_enrolled(self):
+        """Test that enrolling twice does not touch the course roster again."""
+        self.student.enrolled_courses["CS101"] = None
+        add_student, calls = _recording_stub(False)
+        with patch.object(Course, 'add_student', add_student):
+            self.student.enroll_course(self.course1, None)
+
+        self.assertEqual(calls, [])
+        self.assertIn("CS101", self.student.enrolled_courses)
+
     def test_drop_course(self):
         """Test dropping an enrolled course."""
         # First enroll in course
         self.student.enrolled_courses["CS101"] = "A"
-        self.course1.remove_student = MagicMock()
-
-        self.student.drop_course(self.course1)
+        remove_student, calls = _recording_stub()
+        with patch.object(Course, 'remove_student', remove_student):
+            self.student.drop_course(self.course1)
 
         # Verify student was removed from course
-        self.course1.remove_student.assert_called_once_with(self.student)
+        self.assertEqual(calls, [self.student])
 
         # Verify course was removed from student's enrolled courses
         self.assertNotIn("CS101", self.student.enrolled_courses)
 
+    def test_drop_course_not_enrolled(self):
+        """Test that dropping a course the student never took does nothing."""
+        remove_student, calls = _recording_stub()
+        with patch.object(Course, 'remove_student', remove_student):
+            self.student.drop_course(self.course1)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(len(self.student.enrolled_courses), 0)
+
     def test_calculate_gpa(self):
         """Test GPA calculation with various grades."""
-        # Add courses with grades
-        self.student.enrolled_courses = {
-            "CS101": "A",  # 4.0 * 3 = 12 points
-            "CS201": "B",  # 3.0 * 3 = 9 points
-            "CS301": "C"   # 2.0 * 3 = 6 points
-        }
-        # Total: 27 points, 9 credits, GPA = 3.0
+        # Add courses with grades; the test only reads them
+        self.student.enrolled_courses = dict(_GPA_ABC)
 
         gpa = self.student.calculate_gpa()
         self.assertEqual(gpa, 3.0)
@@ -103,25 +168,122 @@ class TestStudent(unittest.TestCase):
 
     def test_calculate_gpa_no_grades(self):
         """Test GPA calculation with no graded courses."""
-        self.student.enrolled_courses = {"CS101": None}  # No grade assigned
+        self.student.enrolled_courses = dict(_GPA_UNGRADED)  # No grade assigned
 
         gpa = self.student.calculate_gpa()
         self.assertEqual(gpa, 0.0)
 
+    def test_set_grade_refreshes_gpa(self):
+        """Test that a cached GPA is recomputed after set_grade()."""
+        self.student.enrolled_courses = {"CS101": "A", "CS201": None}
+        self.assertEqual(self.student.calculate_gpa(), 4.0)
+
+        self.student.set_grade("CS201", "C")
+        self.assertEqual(self.student.calculate_gpa(), 3.0)
+
+    def test_assigned_mapping_is_copied(self):
+        """Test that a read-only mapping is copied into a mutable record."""
+        course = Course("MATH101", "Calculus", 3)
+        self.student.enrolled_courses = MappingProxyType({"CS101": "A"})
+
+        self.student.enroll_course(course, None)
+        self.assertIn("MATH101", self.student.enrolled_courses)
+        self.assertIn(self.student.person_id, course.students_enrolled)
+
+        self.student.drop_course(course)
+        self.assertNotIn("MATH101", self.student.enrolled_courses)
+
+    def test_direct_grade_write_refreshes_gpa(self):
+        """Test that grades written straight into enrolled_courses are not cached over."""
+        self.student.enrolled_courses = {"CS101": "A"}
+        self.assertEqual(self.student.calculate_gpa(), 4.0)
+
+        self.student.enrolled_courses["CS101"] = "F"
+        self.assertEqual(self.student.calculate_gpa(), 0.0)
+
+        self.student.enrolled_courses.update(CS201="B")
+        self.assertEqual(self.student.calculate_gpa(), 1.5)
+
+        del self.student.enrolled_courses["CS101"]
+        self.assertEqual(self.student.calculate_gpa(), 3.0)
+
+    def test_set_grade_invalid(self):
+        """Test that set_grade() rejects unknown courses and grades."""
+        self.student.enrolled_courses = {"CS101": None}
+
+        with self.assertRaises(ValueError):
+            self.student.set_grade("CS999", "A")
+        with self.assertRaises(ValueError):
+            self.student.set_grade("CS101", "E")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_bulk_calculate_gpa(self):
+        """Test that bulk GPA calculation matches calculate_gpa()."""
+        grade_sets = [
+            {"CS101": "A", "CS201": "B", "CS301": "C"},
+            {"CS101": None},
+            {},
+            {"CS101": "B", "CS201": "A", "CS301": None},
+        ]
+        students = []
+        for i, grades in enumerate(grade_sets):
+            student = Student(f"S{i}", "Student", "2000-01-01", "CS")
+            student.enrolled_courses = grades
+            students.append(student)
+
+        gpas = Student.bulk_calculate_gpa(students)
+
+        self.assertEqual(gpas.tolist(), [3.0, 0.0, 0.0, 3.5])
+        for student, gpa in zip(students, gpas.tolist()):
+            self.assertEqual(student.gpa, gpa)
+            self.assertEqual(student.calculate_gpa(), gpa)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_bulk_calculate_gpa_rounding_tie(self):
+        """Test that bulk GPA rounds a .xx5 mean the same way as calculate_gpa()."""
+        # 19 A + 1 D + 20 F = 77 points over 40 courses, a mean of 1.925
+        grades = ["A"] * 19 + ["D"] + ["F"] * 20
+        records = {f"C{i:02d}": grade for i, grade in enumerate(grades)}
+
+        reference = Student("S1", "Student", "2000-01-01", "CS")
+        reference.enrolled_courses = records
+        bulk = Student("S2", "Student", "2000-01-01", "CS")
+        bulk.enrolled_courses = records
+
+        expected = reference.calculate_gpa()
+        self.assertEqual(expected, 1.93)
+        self.assertEqual(Student.bulk_calculate_gpa([bulk]).tolist(), [expected])
+        self.assertEqual(bulk.gpa, expected)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_bulk_academic_status(self):
+        """Test that bulk status classification matches get_academic_status()."""
+        grade_sets = [{"CS101": "A"}, {"CS101": "C", "CS201": "B"}, {"CS101": "F"}, {}]
+        students = []
+        for i, grades in enumerate(grade_sets):
+            student = Student(f"S{i}", "Student", "2000-01-01", "CS")
+            student.enrolled_courses = grades
+            students.append(student)
+
+        statuses = Student.bulk_academic_status(students)
+
+        self.assertEqual(statuses, ["Dean's List", "Good Standing", "Probation", "Probation"])
+        self.assertEqual(statuses, [student.get_academic_status() for student in students])
+
     def test_get_academic_status(self):
         """Test academic status determination based on GPA."""
         # Test Dean's List (GPA >= 3.5)
-        self.student.enrolled_courses = {"CS101": "A"}  # GPA = 4.0
+        self.student.enrolled_courses = dict(_GRADES_A)
         status = self.student.get_academic_status()
         self.assertEqual(status, "Dean's List")
 
         # Test Good Standing (2.0 <= GPA < 3.5)
-        self.student.enrolled_courses = {"CS101": "C"}  # GPA = 2.0
+        self.student.enrolled_courses = dict(_GRADES_C)
         status = self.student.get_academic_status()
         self.assertEqual(status, "Good Standing")
 
         # Test Probation (GPA < 2.0)
-        self.student.enrolled_courses = {"CS101": "F"}  # GPA = 0.0
+        self.student.enrolled_courses = dict(_GRADES_F)
         status = self.student.get_academic_status()
         self.assertEqual(status, "Probation")
 
@@ -129,9 +291,21 @@ class TestStudent(unittest.TestCase):
         """Test that student responsibilities include base and academic duties."""
         responsibilities = self.student.get_responsibilities()
 
+        self.assertIsInstance(responsibilities, tuple)
         self.assertIn("Adhere to university policies.", responsibilities)
         self.assertIn("Attend classes and complete coursework.", responsibilities)
 
+    def test_no_instance_dict(self):
+        """Test that students use __slots__ instead of a per-instance dict."""
+        students = [
+            self.student,
+            UndergraduateStudent("U001", "Jane Doe", "2000-01-01", "Physics", 2),
+            GraduateStudent("G001", "Bob Smith", "1995-05-15", "Mathematics", "Dr. Johnson"),
+        ]
+        for student in students:
+            with self.subTest(student=type(student).__name__):
+                self.assertFalse(hasattr(student, '__dict__'))
+
 
 class TestUndergraduateStudent(unittest.TestCase):
     """Test cases for the UndergraduateStudent class."""
@@ -174,9 +348,12 @@ class TestSecureStudentRecord(unittest.TestCase):
         """Test GPA setter with valid values."""
         valid_gpas = [0.0, 2.5, 4.0]
 
+        # Gather every round trip and compare once
+        results = []
         for gpa in valid_gpas:
             self.secure_record.set_gpa(gpa)
-            self.assertEqual(self.secure_record.get_gpa(), gpa)
+            results.append(self.secure_record.get_gpa())
+        self.assertEqual(results, valid_gpas)
 
     def test_gpa_setter_invalid_values(self):
         """Test GPA setter with invalid values raises ValueError."""
@@ -186,18 +363,23 @@ class TestSecureStudentRecord(unittest.TestCase):
             with self.assertRaises(ValueError):
                 self.secure_record.set_gpa(gpa)
 
+    def test_gpa_property(self):
+        """Test that the gpa property validates like set_gpa()."""
+        self.secure_record.gpa = 2.0
+        self.assertEqual(self.secure_record.gpa, 2.0)
+        self.assertEqual(self.secure_record.student_name, "Test Student")
+
+        with self.assertRaises(ValueError):
+            self.secure_record.gpa = 4.5
+        self.assertEqual(self.secure_record.get_gpa(), 2.0)
+
     def test_can_enroll_more(self):
         """Test enrollment limit checking."""
         # Initially should be able to enroll more (0 < 5)
         self.assertTrue(self.secure_record.can_enroll_more())
 
         # Add courses to reach limit
-        for i in range(5):
-            self.student.enrolled_courses[f"CS{100+i}"] = None
+        self.student.enrolled_courses.update(_FILLER_COURSES)
 
         # Should not be able to enroll more (5 >= 5)
         self.assertFalse(self.secure_record.can_enroll_more())
-
-
-if __name__ == '__main__':
-    unittest.main()